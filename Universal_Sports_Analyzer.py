@@ -1,3 +1,5 @@
+import functools
+import numpy as np
 import pandas as pd
 import os
 import re
@@ -61,6 +63,24 @@ def normalize_team_name(team):
     team = team.strip().upper()
     return TEAM_ALIASES.get(team, team)
 
+TEAM_ALIAS_SERIES = pd.Series(TEAM_ALIASES)
+
+def normalize_team_series(teams):
+    """normalize_team_name for a whole column, as vectorized string ops + one map."""
+    teams = teams.str.strip().str.upper()
+    return teams.map(TEAM_ALIAS_SERIES).fillna(teams)
+
+def team_isin(teams, team_list):
+    """
+    normalize_team_series(teams.astype(str)).isin(team_list), normalizing each
+    distinct team code once and gathering the mask back by factorized code.
+    """
+    codes, uniques = pd.factorize(teams.astype(str))
+    hit = normalize_team_series(pd.Series(uniques, dtype=object)).isin(team_list).to_numpy()
+    # code -1 (missing) lands on the trailing False slot
+    hit = np.append(hit, False)
+    return pd.Series(hit[codes], index=teams.index)
+
 # --------------------------------------------------
 # Traded Players List and Functions
 # --------------------------------------------------
@@ -70,10 +90,8 @@ TRADED_PLAYERS = {
 }
 
 def update_traded_players(df, player_col="PLAYER", team_col="TEAM"):
-    df[team_col] = df.apply(
-        lambda row: TRADED_PLAYERS.get(str(row[player_col]).strip().lower(), row[team_col]),
-        axis=1
-    )
+    new_team = df[player_col].astype(str).str.strip().str.lower().map(TRADED_PLAYERS)
+    df[team_col] = new_team.where(new_team.notna(), df[team_col])
     return df
 
 def is_traded_excluded(player_name, current_teams):
@@ -84,6 +102,13 @@ def is_traded_excluded(player_name, current_teams):
             return True
     return False
 
+def traded_excluded(players, current_teams):
+    """is_traded_excluded for a whole column of player names."""
+    new_team = players.astype(str).str.strip().str.lower().map(
+        {name: team.strip().upper() for name, team in TRADED_PLAYERS.items()}
+    )
+    return new_team.notna() & ~new_team.isin(current_teams)
+
 # --------------------------------------------------
 # Banned Players Handling
 # --------------------------------------------------
@@ -103,13 +128,25 @@ STAT_SPECIFIC_BANNED = {
     "3PM": {"Klay Thompson"}
 }
 
-def is_banned(player_name, stat=None):
-    player = player_name.strip().lower()
+@functools.lru_cache(maxsize=None)
+def banned_players_for(stat=None):
+    """Lowercased names banned for `stat` (global + stat-specific), built once per stat."""
+    banned = set(GLOBAL_BANNED_PLAYERS_SET)
     if stat:
-        banned_for_stat = {p.lower() for p in STAT_SPECIFIC_BANNED.get(stat.upper(), set())}
-        if player in banned_for_stat:
-            return True
-    return player in GLOBAL_BANNED_PLAYERS_SET
+        banned.update(p.strip().lower() for p in STAT_SPECIFIC_BANNED.get(stat.upper(), set()))
+    return frozenset(banned)
+
+def is_banned(player_name, stat=None):
+    return player_name.strip().lower() in banned_players_for(stat)
+
+def banned_mask(players, stat=None):
+    """is_banned for a whole column of player names."""
+    return players.astype(str).str.strip().str.lower().isin(banned_players_for(stat))
+
+def drop_banned(names, stat=None):
+    """`names` minus anyone banned for `stat`."""
+    banned = banned_players_for(stat)
+    return [n for n in names if str(n).strip().lower() not in banned]
 
 # --------------------------------------------------
 # Utility Functions: Header Cleaning and MLB Name Fixing
@@ -130,24 +167,33 @@ preserved_suffixes = {"JR", "SR", "III", "IV", "V"}
 known_positions = {"RF", "CF", "LF", "SS", "C", "1B", "2B", "3B", "OF", "DH"}
 
 def deduplicate_token(token):
-    n = len(token)
-    for i in range(1, n // 2 + 1):
-        if n % i == 0 and token.lower() == (token[:i].lower() * (n // i)):
-            return token[:i]
+    # the smallest i with token == token[:i] * (n // i) is the first place the
+    # token reappears inside itself doubled; str.find does that scan in C
+    lowered = token.lower()
+    i = (lowered + lowered).find(lowered, 1)
+    if 0 < i < len(token):
+        return token[:i]
     return token
 
+_SUFFIX_RE = re.compile(r'\b(Jr|SR|III|IV|V)[\.]?\b', flags=re.IGNORECASE)
+_LEADING_DIGITS_RE = re.compile(r'^\d+')
+_TRAILING_DIGITS_RE = re.compile(r'\d+$')
+_WS_RE = re.compile(r'\s+')
+_TRAILING_NONALPHA_RE = re.compile(r'[^A-Za-z]+$')
+
+@functools.lru_cache(maxsize=4096)
 def fix_mlb_player_name(name):
-    name = re.sub(r'\b(Jr|SR|III|IV|V)[\.]?\b', r' \1 ', name, flags=re.IGNORECASE)
-    name = re.sub(r'^\d+', '', name)
-    name = re.sub(r'\d+$', '', name)
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _SUFFIX_RE.sub(r' \1 ', name)
+    name = _LEADING_DIGITS_RE.sub('', name)
+    name = _TRAILING_DIGITS_RE.sub('', name)
+    name = _WS_RE.sub(' ', name).strip()
     tokens = name.split()
     new_tokens = []
     for token in tokens:
         if token.upper() in preserved_suffixes:
             new_tokens.append(token)
             continue
-        token = re.sub(r'[^A-Za-z]+$', '', token).strip()
+        token = _TRAILING_NONALPHA_RE.sub('', token).strip()
         for pos in known_positions:
             if token.upper().endswith(pos) and len(token) > len(pos):
                 token = token[:-len(pos)].strip()
@@ -159,23 +205,19 @@ def fix_mlb_player_name(name):
         new_tokens.append(token)
     if len(new_tokens) > 1 and len(new_tokens[-1]) == 1:
         new_tokens = new_tokens[:-1]
-    combined = []
+    # merge runs of single letters into initials and drop consecutive repeats
+    # in the same sweep
+    final_tokens = []
     i = 0
     while i < len(new_tokens):
-        if len(new_tokens[i]) == 1:
-            initials = new_tokens[i]
-            i += 1
+        token = new_tokens[i]
+        i += 1
+        if len(token) == 1:
             while i < len(new_tokens) and len(new_tokens[i]) == 1:
-                initials += new_tokens[i]
+                token += new_tokens[i]
                 i += 1
-            if initials.upper() == "JJ":
-                initials = "JC"
-            combined.append(initials)
-        else:
-            combined.append(new_tokens[i])
-            i += 1
-    final_tokens = []
-    for token in combined:
+            if token.upper() == "JJ":
+                token = "JC"
         if final_tokens and token.lower() == final_tokens[-1].lower():
             continue
         final_tokens.append(token)
@@ -188,21 +230,29 @@ def fix_mlb_player_name(name):
 # --------------------------------------------------
 # NHL Per-Game Stat Calculation Functions
 # --------------------------------------------------
-def calculate_per_game_stat(df, raw_stat, new_stat_name, games_column="GP"):
+def games_played(df, games_column="GP"):
+    """The per-game divisor: games played as numbers, with 0 games as NA."""
     if games_column in df.columns:
         games = pd.to_numeric(df[games_column], errors='coerce')
     elif "G" in df.columns:
         games = pd.to_numeric(df["G"], errors='coerce')
     else:
         games = pd.Series([1] * len(df))
+    return games.replace(0, pd.NA)
+
+def calculate_per_game_stat(df, raw_stat, new_stat_name, games_column="GP", games=None):
+    if games is None:
+        games = games_played(df, games_column)
     stat_values = pd.to_numeric(df[raw_stat], errors='coerce')
-    df[new_stat_name] = stat_values / games.replace(0, pd.NA)
+    df[new_stat_name] = stat_values / games
     return df
 
 def calculate_nhl_per_game_stats(df):
-    df = calculate_per_game_stat(df, "A", "A")
-    df = calculate_per_game_stat(df, "P", "PTS")
-    df = calculate_per_game_stat(df, "S", "shotsPerGame")
+    # parse the games column once for all three stats
+    games = games_played(df)
+    df = calculate_per_game_stat(df, "A", "A", games=games)
+    df = calculate_per_game_stat(df, "P", "PTS", games=games)
+    df = calculate_per_game_stat(df, "S", "shotsPerGame", games=games)
     return df
 
 # --------------------------------------------------
@@ -212,7 +262,7 @@ def categorize_players(df, stat_choice, target_value, player_col, team_col, stat
     if df.empty:
         print("❌ DataFrame is empty. Check if the CSV data are correct.")
         return "❌ DataFrame is empty. Check if the CSV data are correct."
-    df = df[~df[player_col].apply(lambda x: is_banned(x, stat_for_ban))]
+    df = df[~banned_mask(df[player_col], stat_for_ban)]
     try:
         df[stat_choice] = pd.to_numeric(df[stat_choice], errors='coerce')
     except Exception as e:
@@ -342,7 +392,7 @@ def load_and_clean_mlb_stats():
     if "TEAM" not in df.columns:
         print("Error: 'TEAM' column not found in the MLB stats CSV.")
         return pd.DataFrame()
-    df["TEAM"] = df["TEAM"].astype(str).apply(normalize_team_name)
+    df["TEAM"] = normalize_team_series(df["TEAM"].astype(str))
     return df
 
 def integrate_mlb_data():
@@ -373,7 +423,7 @@ def analyze_mlb_noninteractive(df, teams, stat_choice, banned_stat=None):
     if teams:
         team_list = ([normalize_team_name(t) for t in teams.split(",") if t.strip()]
                      if isinstance(teams, str) else [normalize_team_name(t) for t in teams])
-        filtered_df = df[df["TEAM"].astype(str).apply(normalize_team_name).isin(team_list)].copy()
+        filtered_df = df[team_isin(df["TEAM"], team_list)].copy()
     else:
         filtered_df = df.copy()
     if filtered_df.empty:
@@ -387,7 +437,7 @@ def analyze_mlb_noninteractive(df, teams, stat_choice, banned_stat=None):
         return f"Error converting stat column: {e}"
     sorted_df = filtered_df.sort_values(by=mapped_stat, ascending=False)
     sorted_df = sorted_df.drop_duplicates(subset=["PLAYER"])
-    sorted_df = sorted_df[~sorted_df["PLAYER"].apply(lambda x: is_banned(x, stat_choice))]
+    sorted_df = sorted_df[~banned_mask(sorted_df["PLAYER"], stat_choice)]
     non_banned = sorted_df["PLAYER"].tolist()
     players_to_use = non_banned[:9] if len(non_banned) >= 9 else non_banned
     yellow_list = players_to_use[0:3]
@@ -410,14 +460,14 @@ def analyze_mlb_by_team_interactive(df, mapped_stat):
             break
         if teams_input:
             team_list = [x.strip() for x in teams_input.split(",")]
-            filtered_df = df[df["TEAM"].astype(str).apply(normalize_team_name).isin(team_list)]
+            filtered_df = df[team_isin(df["TEAM"], team_list)]
         else:
             filtered_df = df
         if filtered_df.empty:
             print("❌ No matching teams found.")
             continue
         sorted_df = filtered_df.sort_values(by=[mapped_stat], ascending=False)
-        sorted_df = sorted_df[~sorted_df["PLAYER"].apply(lambda x: is_banned(x, mapped_stat))]
+        sorted_df = sorted_df[~banned_mask(sorted_df["PLAYER"], mapped_stat)]
         non_banned = sorted_df["PLAYER"].tolist()
         if len(non_banned) < 9:
             players_to_use = non_banned
@@ -484,9 +534,9 @@ def analyze_nhl_psp(file_path, stat_key):
     if player_col is None:
         return "Player column not found in CSV."
     
-    green_list = [x for x in green[player_col].tolist() if not is_banned(str(x), stat_key)]
-    yellow_list = [x for x in yellow[player_col].tolist() if not is_banned(str(x), stat_key)]
-    red_list = [x for x in red[player_col].tolist() if not is_banned(str(x), stat_key)]
+    green_list = drop_banned(green[player_col], stat_key)
+    yellow_list = drop_banned(yellow[player_col], stat_key)
+    red_list = drop_banned(red[player_col], stat_key)
     
     output = f"🟢 {', '.join(str(x) for x in green_list)}\n"
     output += f"🟡 {', '.join(str(x) for x in yellow_list)}\n"
@@ -507,8 +557,8 @@ def analyze_sport_noninteractive(df, stat_categories, player_col, team_col, team
         team_list = [normalize_team_name(t) for t in teams.split(",") if t.strip()]
     else:
         team_list = [normalize_team_name(t) for t in teams]
-    filtered_df = df[df[team_col].astype(str).apply(normalize_team_name).isin(team_list)].copy()
-    filtered_df = filtered_df[~filtered_df["PLAYER"].apply(lambda x: is_traded_excluded(x, team_list))]
+    filtered_df = df[team_isin(df[team_col], team_list)].copy()
+    filtered_df = filtered_df[~traded_excluded(filtered_df["PLAYER"], team_list)]
     if filtered_df.empty:
         return "❌ No matching teams found."
     mapped_stat = stat_categories.get(stat_choice)
@@ -531,8 +581,7 @@ def analyze_sport_noninteractive(df, stat_categories, player_col, team_col, team
     if stat_categories == STAT_CATEGORIES_NBA:
         sorted_overall = df_mode.sort_values(by="Success_Rate", ascending=False)
         sorted_overall = sorted_overall.drop_duplicates(subset=[player_col])
-        all_non_banned = [player for player in sorted_overall[player_col].tolist() 
-                            if not is_banned(player, stat_choice)]
+        all_non_banned = drop_banned(sorted_overall[player_col], stat_choice)
         non_banned = all_non_banned[:9]
         yellow_list = non_banned[0:3]
         green_list = non_banned[3:6]
@@ -556,9 +605,9 @@ def analyze_sport_noninteractive(df, stat_categories, player_col, team_col, team
             final_df[final_df["Category"] == "🟡 Favorite"].sort_values(by="Success_Rate", ascending=False),
             final_df[final_df["Category"] == "🔴 Underdog"].sort_values(by="Success_Rate", ascending=True)
         ]).reset_index(drop=True)
-        non_banned = [player for player in final_df[player_col].tolist() if not is_banned(player, stat_choice)]
+        non_banned = drop_banned(final_df[player_col], stat_choice)
         if len(non_banned) < 9:
-            all_non_banned = [player for player in df_mode[player_col].tolist() if not is_banned(player, stat_choice)]
+            all_non_banned = drop_banned(df_mode[player_col], stat_choice)
             non_banned = all_non_banned[:9]
         else:
             non_banned = non_banned[:9]
@@ -629,7 +678,7 @@ def analyze_nhl_noninteractive(df, teams, stat_choice, target_value=None, banned
         else:
             sorted_df = df_mode.sort_values(by=mapped_stat, ascending=False)
         sorted_df = sorted_df.drop_duplicates(subset=["Player"])
-        sorted_df = sorted_df[~sorted_df["Player"].apply(lambda x: is_banned(x, stat_choice))]
+        sorted_df = sorted_df[~banned_mask(sorted_df["Player"], stat_choice)]
         non_banned = sorted_df["Player"].tolist()
         if len(non_banned) >= 15:
             yellow = non_banned[0:3]
@@ -652,7 +701,7 @@ def analyze_cbb_noninteractive(df, teams, stat_choice, target_value, banned_stat
         team_list = [normalize_team_name(t) for t in teams.split(",") if t.strip()]
     else:
         team_list = [normalize_team_name(t) for t in teams]
-    filtered_df = df[df[team_col].astype(str).apply(normalize_team_name).isin(team_list)].copy()
+    filtered_df = df[team_isin(df[team_col], team_list)].copy()
     if filtered_df.empty:
         return "❌ No matching teams found."
     mapped_stat = STAT_CATEGORIES_CBB.get(stat_choice)
@@ -682,9 +731,9 @@ def analyze_cbb_noninteractive(df, teams, stat_choice, target_value, banned_stat
     red_players = red_players[red_players["Success_Rate"] >= MIN_CBB_RED_SUCCESS_RATE]
     red_players = red_players.sort_values(by="Success_Rate", ascending=True).head(3)
     red_players["Category"] = "🔴 Underdog"
-    green_list = [player for player in green_players["Player"].tolist() if not is_banned(player, stat_choice)]
-    yellow_list = [player for player in yellow_players["Player"].tolist() if not is_banned(player, stat_choice)]
-    red_list = [player for player in red_players["Player"].tolist() if not is_banned(player, stat_choice)]
+    green_list = drop_banned(green_players["Player"], stat_choice)
+    yellow_list = drop_banned(yellow_players["Player"], stat_choice)
+    red_list = drop_banned(red_players["Player"], stat_choice)
     green_output = ", ".join(green_list) if green_list else "No Green Plays"
     yellow_output = ", ".join(yellow_list) if yellow_list else "No Yellow Plays"
     red_output = ", ".join(red_list) if red_list else "No Red Plays"
@@ -702,7 +751,7 @@ def analyze_sport(df, stat_categories, player_col, team_col):
         if teams_input.lower() == 'exit':
             break
         team_list = [normalize_team_name(t) for t in teams_input.split(",") if t.strip()]
-        filtered_df = df[df[team_col].astype(str).apply(normalize_team_name).isin(team_list)].copy()
+        filtered_df = df[team_isin(df[team_col], team_list)].copy()
         if filtered_df.empty:
             print("❌ No matching teams found. Please check the team names.")
             continue
@@ -797,7 +846,7 @@ def analyze_nhl_flow(df):
             else:
                 sorted_df = df_mode.sort_values(by=mapped_stat, ascending=False)
             sorted_df = sorted_df.drop_duplicates(subset=["Player"])
-            sorted_df = sorted_df[~sorted_df["Player"].apply(lambda x: is_banned(x, stat_choice))]
+            sorted_df = sorted_df[~banned_mask(sorted_df["Player"], stat_choice)]
             non_banned = sorted_df["Player"].tolist()
             if len(non_banned) >= 15:
                 yellow = non_banned[0:3]
@@ -873,13 +922,8 @@ def integrate_cbb_data(player_stats_file="cbb_player_stats.csv", injury_data_fil
         print("Merge error for CBB data:", e)
         return stats_df
     if "injuryStatus" in integrated_data.columns:
-        mask = (
-            integrated_data["injuryStatus"].fillna("")
-            .str.lower()
-            .str.contains("out indefinitely") |
-            integrated_data["injuryStatus"].fillna("")
-            .str.lower()
-            .str.contains("out for season")
+        mask = integrated_data["injuryStatus"].fillna("").str.contains(
+            r"out (?:indefinitely|for season)", case=False, regex=True
         )
         integrated_data = integrated_data[~mask]
     if "Team" not in integrated_data.columns:
@@ -924,9 +968,9 @@ def analyze_nhl_psp(file_path, stat_key):
     player_col = "NAME" if "NAME" in sorted_df.columns else None
     if player_col is None:
         return "Player column not found in CSV."
-    green_list = [x for x in green[player_col].tolist() if not is_banned(str(x), stat_key)]
-    yellow_list = [x for x in yellow[player_col].tolist() if not is_banned(str(x), stat_key)]
-    red_list = [x for x in red[player_col].tolist() if not is_banned(str(x), stat_key)]
+    green_list = drop_banned(green[player_col], stat_key)
+    yellow_list = drop_banned(yellow[player_col], stat_key)
+    red_list = drop_banned(red[player_col], stat_key)
     output = f"🟢 {', '.join(str(x) for x in green_list)}\n"
     output += f"🟡 {', '.join(str(x) for x in yellow_list)}\n"
     output += f"🔴 {', '.join(str(x) for x in red_list)}"
@@ -946,8 +990,8 @@ def analyze_sport_noninteractive(df, stat_categories, player_col, team_col, team
         team_list = [normalize_team_name(t) for t in teams.split(",") if t.strip()]
     else:
         team_list = [normalize_team_name(t) for t in teams]
-    filtered_df = df[df[team_col].astype(str).apply(normalize_team_name).isin(team_list)].copy()
-    filtered_df = filtered_df[~filtered_df["PLAYER"].apply(lambda x: is_traded_excluded(x, team_list))]
+    filtered_df = df[team_isin(df[team_col], team_list)].copy()
+    filtered_df = filtered_df[~traded_excluded(filtered_df["PLAYER"], team_list)]
     if filtered_df.empty:
         return "❌ No matching teams found."
     mapped_stat = stat_categories.get(stat_choice)
@@ -970,8 +1014,7 @@ def analyze_sport_noninteractive(df, stat_categories, player_col, team_col, team
     if stat_categories == STAT_CATEGORIES_NBA:
         sorted_overall = df_mode.sort_values(by="Success_Rate", ascending=False)
         sorted_overall = sorted_overall.drop_duplicates(subset=[player_col])
-        all_non_banned = [player for player in sorted_overall[player_col].tolist() 
-                            if not is_banned(player, stat_choice)]
+        all_non_banned = drop_banned(sorted_overall[player_col], stat_choice)
         non_banned = all_non_banned[:9]
         yellow_list = non_banned[0:3]
         green_list = non_banned[3:6]
@@ -995,9 +1038,9 @@ def analyze_sport_noninteractive(df, stat_categories, player_col, team_col, team
             final_df[final_df["Category"] == "🟡 Favorite"].sort_values(by="Success_Rate", ascending=False),
             final_df[final_df["Category"] == "🔴 Underdog"].sort_values(by="Success_Rate", ascending=True)
         ]).reset_index(drop=True)
-        non_banned = [player for player in final_df[player_col].tolist() if not is_banned(player, stat_choice)]
+        non_banned = drop_banned(final_df[player_col], stat_choice)
         if len(non_banned) < 9:
-            all_non_banned = [player for player in df_mode[player_col].tolist() if not is_banned(player, stat_choice)]
+            all_non_banned = drop_banned(df_mode[player_col], stat_choice)
             non_banned = all_non_banned[:9]
         else:
             non_banned = non_banned[:9]
@@ -1068,7 +1111,7 @@ def analyze_nhl_noninteractive(df, teams, stat_choice, target_value=None, banned
         else:
             sorted_df = df_mode.sort_values(by=mapped_stat, ascending=False)
         sorted_df = sorted_df.drop_duplicates(subset=["Player"])
-        sorted_df = sorted_df[~sorted_df["Player"].apply(lambda x: is_banned(x, stat_choice))]
+        sorted_df = sorted_df[~banned_mask(sorted_df["Player"], stat_choice)]
         non_banned = sorted_df["Player"].tolist()
         if len(non_banned) >= 15:
             yellow = non_banned[0:3]
@@ -1091,7 +1134,7 @@ def analyze_cbb_noninteractive(df, teams, stat_choice, target_value, banned_stat
         team_list = [normalize_team_name(t) for t in teams.split(",") if t.strip()]
     else:
         team_list = [normalize_team_name(t) for t in teams]
-    filtered_df = df[df[team_col].astype(str).apply(normalize_team_name).isin(team_list)].copy()
+    filtered_df = df[team_isin(df[team_col], team_list)].copy()
     if filtered_df.empty:
         return "❌ No matching teams found."
     mapped_stat = STAT_CATEGORIES_CBB.get(stat_choice)
@@ -1121,9 +1164,9 @@ def analyze_cbb_noninteractive(df, teams, stat_choice, target_value, banned_stat
     red_players = red_players[red_players["Success_Rate"] >= MIN_CBB_RED_SUCCESS_RATE]
     red_players = red_players.sort_values(by="Success_Rate", ascending=True).head(3)
     red_players["Category"] = "🔴 Underdog"
-    green_list = [player for player in green_players["Player"].tolist() if not is_banned(player, stat_choice)]
-    yellow_list = [player for player in yellow_players["Player"].tolist() if not is_banned(player, stat_choice)]
-    red_list = [player for player in red_players["Player"].tolist() if not is_banned(player, stat_choice)]
+    green_list = drop_banned(green_players["Player"], stat_choice)
+    yellow_list = drop_banned(yellow_players["Player"], stat_choice)
+    red_list = drop_banned(red_players["Player"], stat_choice)
     green_output = ", ".join(green_list) if green_list else "No Green Plays"
     yellow_output = ", ".join(yellow_list) if yellow_list else "No Yellow Plays"
     red_output = ", ".join(red_list) if red_list else "No Red Plays"
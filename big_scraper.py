@@ -32,6 +32,32 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 from io import StringIO
+import atexit
+
+# One headless Chrome shared by the NHL and MLB scrapers, started on first use
+# and kept for later runs in the same process (main.py's menu calls run())
+_DRIVER = None
+
+def get_shared_driver():
+    global _DRIVER
+    if _DRIVER is None:
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless")
+        options.add_argument("--disable-gpu")
+        _DRIVER = webdriver.Chrome(options=options)
+    return _DRIVER
+
+def close_shared_driver():
+    """Quit the shared driver; the next get_shared_driver() starts a fresh one."""
+    global _DRIVER
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+        except Exception:
+            pass
+        _DRIVER = None
+
+atexit.register(close_shared_driver)
 
 # ==============================
 # CBB Scraper (College Basketball)
@@ -223,12 +249,11 @@ base_stats_url = "https://www.nhl.com/stats/skaters?reportType=season&seasonFrom
 injury_url_nhl = "https://www.cbssports.com/nhl/injuries/"
 
 def fetch_nhl_player_stats():
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless')
-    driver = webdriver.Chrome(options=options)
     all_rows = []
     page = 1
     try:
+        driver = get_shared_driver()
+        driver.set_page_load_timeout(300)
         driver.get(base_stats_url)
         while True:
             table = WebDriverWait(driver, 20).until(
@@ -264,10 +289,11 @@ def fetch_nhl_player_stats():
         print(f"💾 NHL player stats saved to {output_file}")
     except TimeoutException:
         print("Timeout: NHL stats table did not load in time.")
+        # the browser may be wedged; don't hand it to the next scraper
+        close_shared_driver()
     except Exception as e:
         print(f"An error occurred in NHL scraper: {e}")
-    finally:
-        driver.quit()
+        close_shared_driver()
 
 def extract_nhl_injury_data():
     try:
@@ -393,25 +419,24 @@ BASE_URL_MLB = "https://www.mlb.com/stats/rbi/2025?page={}"
 MAX_PAGES = 47
 
 def fetch_raw_table_data():
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    driver = webdriver.Chrome(options=options)
-    driver.set_page_load_timeout(20)
     all_rows = []
     for page in range(1, MAX_PAGES + 1):
         url = BASE_URL_MLB.format(page)
         print("Fetching MLB stats from:", url)
         try:
+            driver = get_shared_driver()
+            driver.set_page_load_timeout(20)
             driver.get(url)
             WebDriverWait(driver, 15).until(
                 EC.presence_of_element_located((By.TAG_NAME, "table"))
             )
             time.sleep(3)
+            page_source = driver.page_source
         except Exception as e:
             print("Error loading MLB stats page", page, e)
+            # the browser may be wedged; the next page (and later runs) start a fresh one
+            close_shared_driver()
             continue
-        page_source = driver.page_source
         soup = BeautifulSoup(page_source, "html.parser")
         table = soup.find("table")
         if not table:
@@ -432,7 +457,6 @@ def fetch_raw_table_data():
         else:
             print("No table body found on MLB stats page", page)
         time.sleep(1)
-    driver.quit()
     return all_rows
 
 def save_mlb_stats_csv():
@@ -518,7 +542,7 @@ def fetch_wnba_player_stats():
     df = df[df["Player"] != "Player"].copy()
     df = df.rename(columns={"Player":"PLAYER","Tm":"TEAM","Team":"TEAM"})
     df["PLAYER"] = df["PLAYER"].str.strip()
-    df["TEAM"]   = df["TEAM"].str.strip().apply(normalize_team_name)
+    df["TEAM"]   = df["TEAM"].str.strip().str.upper()
     return df
 
 def fetch_wnba_injury_data():
@@ -659,7 +683,10 @@ def main():
 
     print("\nBig Scraper completed.")
 
-    
+def run() -> None:
+    """Run every scraper in-process, so main.py's menu can call it without
+    spawning a fresh interpreter."""
+    main()
 
 if __name__ == "__main__":
-    main()
+    run()
@@ -21,11 +21,22 @@ Note: This version fixes issues such as duplicate CBB players,
 
 import os
 import sys
+import csv
 import re
 import time
+import atexit
+import queue
 import asyncio
+import functools
+import inspect
+import hashlib
+import operator
+import pickle
+import threading
 import subprocess
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
 import pandas as pd
 import requests
 import numpy as np
@@ -39,9 +50,28 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
+try:
+    # C parser; parse_table walks its tree directly instead of building bs4 tags
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+try:
+    # multithreaded CSV reader/writer for the scraped PSP dumps, when installed
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PSP_CSV_ENGINE = "pyarrow"
+except ImportError:
+    pa = None
+    PSP_CSV_ENGINE = "c"
+try:
+    # multithreaded CSV parser for the stat/injury loaders, when installed
+    import polars as pl
+except ImportError:
+    pl = None
 
 # Notion client
-from notion_client import Client
+from notion_client import AsyncClient, Client
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -58,15 +88,26 @@ from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
-# configure headless
-chrome_options = Options()
-chrome_options.add_argument("--headless")
+# Copy-on-Write: filtered frames share buffers until written, so the analyzers
+# can skip defensive .copy() calls. Always on (and the option deprecated) from pandas 3.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.options.mode.copy_on_write = True
 
-# now you can safely do:
-driver = webdriver.Chrome(
-    service=Service(ChromeDriverManager().install()),
-    options=chrome_options
-)
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    # install/locate ChromeDriver on first use; every driver reuses this path
+    return ChromeDriverManager().install()
+
+def _chrome_options() -> Options:
+    opts = Options()
+    opts.add_argument("--headless")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+    return opts
+
+def get_driver() -> webdriver.Chrome:
+    """Start a headless Chrome. Nothing Selenium-related runs until this is called."""
+    return webdriver.Chrome(service=Service(_chromedriver_path()), options=_chrome_options())
 
 # ----------------------------
 # Global Directories
@@ -143,25 +184,46 @@ SNBA_TEAM_ALIASES = {
     "PHL": "PHI",
 }
 
+@functools.lru_cache(maxsize=4096)
 def normalize_snba_team_name(team: str) -> str:
     """Normalize only SNBA team codes."""
     t = team.strip().upper()
     return SNBA_TEAM_ALIASES.get(t, t)
 
+@functools.lru_cache(maxsize=4096)
 def normalize_team_name(team):
     team = team.strip().upper()
     return TEAM_ALIASES.get(team, team)
 
+# alias tables as Series, built once so .map() doesn't rebuild a lookup index per call
+TEAM_ALIAS_SERIES = pd.Series(TEAM_ALIASES)
+SNBA_TEAM_ALIAS_SERIES = pd.Series(SNBA_TEAM_ALIASES)
+
+def normalize_team_series(teams: pd.Series, table=TEAM_ALIAS_SERIES) -> pd.Series:
+    """normalize_team_name (or the SNBA variant, via `table`) for a whole column."""
+    teams = teams.str.strip().str.upper()
+    return teams.map(table).fillna(teams)
+
+def team_isin(teams: pd.Series, team_list, table=TEAM_ALIAS_SERIES) -> pd.Series:
+    """
+    normalize_team_series(teams, table).isin(team_list), with the normalization
+    done once per distinct team code: the column is factorized and the mask is
+    a gather over the integer codes (like isin_normalized).
+    """
+    cat = teams.astype("category")
+    codes_hit = normalize_team_series(cat.cat.categories.astype(str).to_series(), table).isin(team_list)
+    # code -1 (missing) lands on the trailing False slot
+    hit = np.append(codes_hit.to_numpy(), False)
+    return pd.Series(hit[cat.cat.codes.to_numpy()], index=teams.index)
+
 TRADED_PLAYERS = {
     "kyle kuzma": "MIL",
     "julie vanloo": "LAS",
 }
 
 def update_traded_players(df, player_col="PLAYER", team_col="TEAM"):
-    df[team_col] = df.apply(
-        lambda row: TRADED_PLAYERS.get(str(row[player_col]).strip().lower(), row[team_col]),
-        axis=1
-    )
+    new_team = df[player_col].astype(str).str.strip().str.lower().map(TRADED_PLAYERS)
+    df[team_col] = new_team.where(new_team.notna(), df[team_col])
     return df
 
 def is_traded_excluded(player_name, current_teams):
@@ -191,6 +253,7 @@ PERMANENT_YELLOW_PLAYERS = {
     "Bryce Harper",
     "Jacob Wilson",
 }
+PERMANENT_YELLOW_LOWER = frozenset(p.lower() for p in PERMANENT_YELLOW_PLAYERS)
 
 # ----------------------------
 # Banned Players Handling
@@ -254,17 +317,39 @@ STAT_SPECIFIC_BANNED = {
     "3PM": {"Klay Thompson"}
 }
 
+@functools.lru_cache(maxsize=None)
+def banned_players_for(stat=None):
+    """
+    Lowercased names banned for `stat` (global bans + stat-specific bans),
+    built once per stat so lookups are a single hash probe.
+    """
+    banned = set(GLOBAL_BANNED_PLAYERS_SET)
+    if stat:
+        banned.update(p.strip().lower() for p in STAT_SPECIFIC_BANNED.get(stat.upper(), set()))
+    return frozenset(banned)
+
+def isin_normalized(values: pd.Series, names) -> pd.Series:
+    """
+    values.astype(str).str.strip().str.lower().isin(names), but with the string
+    work done once per distinct value: the column is factorized into integer
+    codes and the membership test is a gather over those codes.
+    """
+    cat = values.astype("category")
+    hit = cat.cat.categories.astype(str).str.strip().str.lower().isin(names)
+    # code -1 (missing) lands on the trailing False slot
+    hit = np.append(hit, False)
+    return pd.Series(hit[cat.cat.codes.to_numpy()], index=values.index)
+
 def is_banned(player_name, stat=None):
     # Only strings get checked
     if not isinstance(player_name, str):
         return False
+    return player_name.strip().lower() in banned_players_for(stat)
 
-    player = player_name.strip().lower()
-    if stat:
-        banned_for_stat = {p.lower() for p in STAT_SPECIFIC_BANNED.get(stat.upper(), set())}
-        if player in banned_for_stat:
-            return True
-    return player in GLOBAL_BANNED_PLAYERS_SET
+def drop_banned(names, stat=None) -> list:
+    """`names` minus anyone banned for `stat`; the ban set is fetched once for the whole list."""
+    banned = banned_players_for(stat)
+    return [n for n in names if str(n).strip().lower() not in banned]
 
 import re
 
@@ -274,23 +359,32 @@ import re
 import re
 import unicodedata
 
+# (key, lowered key), longest first so e.g. "RBI" wins over "R"; the first key
+# found anywhere in the header wins, which a leftmost-match regex would not keep
+_HEADER_KEYS = tuple(
+    (key, key.lower())
+    for key in sorted(["PLAYER","TEAM","RBI","AVG","OBP","OPS","AB","R","H","G","SO"], key=len, reverse=True)
+)
+
+@functools.lru_cache(maxsize=256)
 def clean_header(header: str) -> str:
     header = header.strip()
     if header.isupper() and len(header) % 2 == 0:
         half = len(header) // 2
         if header[:half] == header[half:]:
             header = header[:half]
-    keys = ["PLAYER","TEAM","RBI","AVG","OBP","OPS","AB","R","H","G","SO"]
-    for key in sorted(keys, key=len, reverse=True):
-        if key.lower() in header.lower():
+    lowered = header.lower()
+    for key, key_lower in _HEADER_KEYS:
+        if key_lower in lowered:
             return key
     return header
 
 # MLB name fixer
-_suffixes = {"Jr","Sr","II","III","IV","V"}
+_suffixes = frozenset({"Jr", "Sr", "II", "III", "IV", "V"})
 # match either a capitalized word (allowing accents & apostrophes) OR an exact suffix
+# (longest first, so "III" isn't taken as "II", and the pattern is the same every run)
 _token_re = re.compile(
-    r"(?:[A-ZÀ-ÖØ-öø-ÿ][a-zà-öø-ÿ']+)|(?:" + "|".join(_suffixes) + r")"
+    r"(?:[A-ZÀ-ÖØ-öø-ÿ][a-zà-öø-ÿ']+)|(?:" + "|".join(sorted(_suffixes, key=lambda s: (-len(s), s))) + r")"
 )
 
 # add a dict of any “weird” raw→desired names
@@ -342,61 +436,114 @@ _raw_snba_overrides = {
     # ... add as you discover more discrepancies
 }
 
-def fix_mlb_player_name(raw: str) -> str:
-    # 1) normalize accents
-    s = unicodedata.normalize("NFC", raw or "")
-    # 2) drop digits & unwanted punctuation
-    s = re.sub(r"[\d\.]", "", s)
-    s = re.sub(r"[^A-Za-zÀ-ÖØ-öø-ÿ'\s]", " ", s)
-    # 3) collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip()
-    # 4) extract only proper name tokens or exact suffixes
-    tokens = _token_re.findall(s)
-    # 5) drop any repeat of a token (except suffixes, which may follow once)
+# character classes stripped from raw MLB names, compiled once
+_DIGITS_DOT = re.compile(r"[\d\.]")
+_NON_NAME   = re.compile(r"[^A-Za-zÀ-ÖØ-öø-ÿ'\s]")
+_WS         = re.compile(r"\s+")
+
+def _join_name_tokens(tokens) -> str:
+    # drop any repeat of a token (except suffixes, which may follow once)
     cleaned = []
+    seen = set()
     for t in tokens:
         if t in _suffixes:
             if cleaned and cleaned[-1] in _suffixes:
                 continue
             cleaned.append(t)
-        else:
-            if t not in cleaned:
-                cleaned.append(t)
-    cleaned_name = " ".join(cleaned)
+        elif t not in seen:
+            seen.add(t)
+            cleaned.append(t)
+    return " ".join(cleaned)
+
+@functools.lru_cache(maxsize=4096)
+def fix_mlb_player_name(raw: str) -> str:
+    # 1) normalize accents
+    s = unicodedata.normalize("NFC", raw or "")
+    # 2) drop digits & unwanted punctuation
+    s = _DIGITS_DOT.sub("", s)
+    s = _NON_NAME.sub(" ", s)
+    # 3) collapse whitespace
+    s = _WS.sub(" ", s).strip()
+    # 4) extract only proper name tokens or exact suffixes, 5) de-dupe them
+    cleaned_name = _join_name_tokens(_token_re.findall(s))
 
     # 6) apply any manual overrides
     return _MLB_NAME_OVERRIDES.get(cleaned_name, cleaned_name)
 
+def fix_mlb_player_names(names: pd.Series) -> pd.Series:
+    """fix_mlb_player_name for a whole column, with the regex passes done column-wide."""
+    # the same player shows up on many rows; clean each distinct name once.
+    # Missing names stay missing (code -1 picks the trailing NA slot below).
+    names = names.astype(str).where(names.notna())
+    codes, uniques = pd.factorize(names)
+    s = (
+        pd.Series(uniques, dtype=object)
+             .str.normalize("NFC")
+             .str.replace(_DIGITS_DOT, "", regex=True)
+             .str.replace(_NON_NAME, " ", regex=True)
+             .str.replace(_WS, " ", regex=True)
+             .str.strip()
+    )
+    cleaned = s.str.findall(_token_re).map(_join_name_tokens).replace(_MLB_NAME_OVERRIDES)
+    values = np.append(cleaned.to_numpy(dtype=object), np.nan)[codes]
+    return pd.Series(values, index=names.index, name=names.name, dtype=names.dtype)
+
 # ----------------------------
 # NHL Per-Game Stat Calculation
 # ----------------------------
-def calculate_per_game_stat(df, raw_stat, new_stat_name, games_column="GP"):
+def games_played(df, games_column="GP"):
+    """The per-game divisor: games played as numbers, with 0 games as NA."""
     if games_column in df.columns:
         games = pd.to_numeric(df[games_column], errors='coerce')
     elif "G" in df.columns:
         games = pd.to_numeric(df["G"], errors='coerce')
     else:
         games = pd.Series([1] * len(df))
+    return games.replace(0, pd.NA)
+
+def calculate_per_game_stat(df, raw_stat, new_stat_name, games_column="GP", games=None):
+    if games is None:
+        games = games_played(df, games_column)
     stat_values = pd.to_numeric(df[raw_stat], errors='coerce')
-    df[new_stat_name] = stat_values / games.replace(0, pd.NA)
+    df[new_stat_name] = stat_values / games
     return df
 
 def calculate_nhl_per_game_stats(df):
-    df = calculate_per_game_stat(df, "A", "A")
-    df = calculate_per_game_stat(df, "P", "PTS")
-    df = calculate_per_game_stat(df, "S", "shotsPerGame")
+    # parse the games column once for all three stats
+    games = games_played(df)
+    df = calculate_per_game_stat(df, "A", "A", games=games)
+    df = calculate_per_game_stat(df, "P", "PTS", games=games)
+    df = calculate_per_game_stat(df, "S", "shotsPerGame", games=games)
     return df
 
 # ----------------------------
 # Categorization Function for All Sports
 # ----------------------------
+CATEGORY_ORDER = ["🟢 Best Bet", "🟡 Favorite", "🔴 Underdog"]
+
+def _top_three(bucket, pool, player_col):
+    """
+    Top 3 of `bucket` by Success_Rate, filled from the best of `pool` if it has
+    fewer than 3. Both must already be sorted best-first (stable, so ties keep
+    frame order as nlargest would), which makes each top-k a head() slice.
+    """
+    picks = bucket.head(3)
+    if len(picks) < 3:
+        extra = pool.head(3 - len(picks))
+        extra = extra[~extra[player_col].isin(picks[player_col])]
+        picks = pd.concat([picks, extra]).sort_values("Success_Rate", ascending=False, kind="stable").head(3)
+    return picks
+
 def categorize_players(df, stat_choice, target_value, player_col, team_col, stat_for_ban=None):
     if df.empty:
         print("❌ DataFrame is empty. Check if the CSV data are correct.")
         return "❌ DataFrame is empty. Check if the CSV data are correct."
-    df = df[~df[player_col].apply(lambda x: is_banned(x, stat_for_ban))]
+    banned = banned_players_for(stat_for_ban)
+    df = df[~isin_normalized(df[player_col], banned)]
     try:
-            df.loc[:, stat_choice] = pd.to_numeric(df[stat_choice], errors='coerce')
+        # whole-column assignment, so the stat becomes float even when the
+        # incoming column was object
+        df[stat_choice] = pd.to_numeric(df[stat_choice], errors='coerce')
     except Exception as e:
         print("Error converting stat column to numeric:", e)
         return f"Error converting stat column: {e}"
@@ -404,52 +551,46 @@ def categorize_players(df, stat_choice, target_value, player_col, team_col, stat
     df = df.drop_duplicates(subset=[player_col])
     if target_value is None or target_value == 0:
         return "Target value required and must be nonzero."
-    df["Success_Rate"] = ((df[stat_choice] / target_value) * 100).round(1)
-    df.loc[df["Success_Rate"] >= 120, "Category"] = "🟡 Favorite"
-    df.loc[(df["Success_Rate"] >= 100) & (df["Success_Rate"] < 120), "Category"] = "🟢 Best Bet"
-    df.loc[df["Success_Rate"] < 100, "Category"] = "🔴 Underdog"
+    # rate and bucket straight off the float64 buffer: one pass, no boolean Series
+    sr = np.round(df[stat_choice].to_numpy(dtype=np.float64) / target_value * 100.0, 1)
+    df["Success_Rate"] = sr
+    df["Category"] = np.select(
+        [sr >= 120, sr >= 100],
+        ["🟡 Favorite", "🟢 Best Bet"],
+        default="🔴 Underdog",
+    )
 
-    stud_lower = {p.lower() for p in PERMANENT_YELLOW_PLAYERS}
-    df.loc[
-        df[player_col].str.strip().str.lower().isin(stud_lower),
-        "Category"
-    ] = "🟡 Favorite"
+    df.loc[isin_normalized(df[player_col], PERMANENT_YELLOW_LOWER), "Category"] = "🟡 Favorite"
 
 
-    df = df.drop_duplicates(subset=[player_col, team_col])
-    
+    # players are already unique here, so each bucket is a plain top-3
+    # topped up from its wider Success_Rate pool when it comes up short;
+    # one sort up front and every bucket/pool below stays best-first
     MIN_CBB_RED_SUCCESS_RATE = 80
-    red_df = df[df["Category"] == "🔴 Underdog"]
-    red_df = red_df[red_df["Success_Rate"] >= MIN_CBB_RED_SUCCESS_RATE]
-    red_players = red_df.nlargest(3, "Success_Rate")
-    if len(red_players) < 3:
-        extra = df[df["Success_Rate"] < 100].nlargest(3 - len(red_players), "Success_Rate")
-        red_players = pd.concat([red_players, extra]).drop_duplicates().nlargest(3, "Success_Rate")
-    
-    green_players = df[df["Category"] == "🟢 Best Bet"].nlargest(3, "Success_Rate")
-    if len(green_players) < 3:
-        extra = df[df["Success_Rate"] >= 100].nlargest(3 - len(green_players), "Success_Rate")
-        green_players = pd.concat([green_players, extra]).drop_duplicates().nlargest(3, "Success_Rate")
-    yellow_players = df[df["Category"] == "🟡 Favorite"].nlargest(3, "Success_Rate")
-    if len(yellow_players) < 3:
-        extra = df[df["Success_Rate"] >= 120].nlargest(3 - len(yellow_players), "Success_Rate")
-        yellow_players = pd.concat([yellow_players, extra]).drop_duplicates().nlargest(3, "Success_Rate")
-    
-    final_df = pd.concat([green_players, yellow_players, red_players]).drop_duplicates(subset=[player_col, team_col]).reset_index(drop=True)
-    final_df = pd.concat([
-        final_df[final_df["Category"] == "🟢 Best Bet"].sort_values(by="Success_Rate", ascending=False),
-        final_df[final_df["Category"] == "🟡 Favorite"].sort_values(by="Success_Rate", ascending=False),
-        final_df[final_df["Category"] == "🔴 Underdog"].sort_values(by="Success_Rate", ascending=True)
-    ]).reset_index(drop=True)
+    df = df.sort_values("Success_Rate", ascending=False, kind="stable")
+    sr = df["Success_Rate"]
+    red_players = _top_three(
+        df[(df["Category"] == "🔴 Underdog") & (sr >= MIN_CBB_RED_SUCCESS_RATE)], df[sr < 100], player_col
+    )
+    green_players = _top_three(df[df["Category"] == "🟢 Best Bet"], df[sr >= 100], player_col)
+    yellow_players = _top_three(df[df["Category"] == "🟡 Favorite"], df[sr >= 120], player_col)
+
+    final_df = pd.concat([green_players, yellow_players, red_players]).drop_duplicates(subset=[player_col, team_col])
+    # one sort: green, yellow, red; best first except red, which runs worst → best
+    red = final_df["Category"] == "🔴 Underdog"
+    final_df = final_df.assign(
+        _bucket=pd.Categorical(final_df["Category"], categories=CATEGORY_ORDER, ordered=True),
+        _key=np.where(red, final_df["Success_Rate"], -final_df["Success_Rate"]),
+    ).sort_values(["_bucket", "_key"], kind="stable").reset_index(drop=True)
     
-    green_list = final_df[final_df["Category"] == "🟢 Best Bet"][player_col].tolist()
-    yellow_list = final_df[final_df["Category"] == "🟡 Favorite"][player_col].tolist()
-    red_list = final_df[final_df["Category"] == "🔴 Underdog"][player_col].tolist()
+    # final_df is already bucket-ordered; slice the three lists off plain arrays
+    names = final_df[player_col].to_numpy(dtype=object)
+    buckets = final_df["Category"].to_numpy(dtype=object)
+    green_list = names[buckets == "🟢 Best Bet"].tolist()
+    yellow_list = names[buckets == "🟡 Favorite"].tolist()
+    red_list = names[buckets == "🔴 Underdog"].tolist()
     
-    unique_green = []
-    for name in green_list:
-        if name not in unique_green:
-            unique_green.append(name)
+    unique_green = list(dict.fromkeys(green_list))
     unique_yellow = [name for name in yellow_list if name not in unique_green]
     unique_red = [name for name in red_list if name not in unique_green and name not in unique_yellow]
     
@@ -465,13 +606,223 @@ def categorize_players(df, stat_choice, target_value, player_col, team_col, stat
 # Integration Functions for Each Sport
 # ----------------------------
 
+# Name/team columns are always text, so skip type inference on them; injury
+# reports are all text and are read that way outright.
+PLAYER_TEAM_DTYPES       = {"PLAYER": str, "TEAM": str}
+PLAYER_TEAM_DTYPES_TITLE = {"Player": str, "Team": str}
+PSP_NAME_DTYPES          = {"NAME": str, "TEAM": str}
+
+# pandas' default NA markers, so polars nulls the same cells read_csv would
+_CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+def _polars_safe_header(path) -> bool:
+    """
+    True if polars would name `path`'s columns the way pandas does: no blank
+    header cells (pandas: "Unnamed: 0") and no repeats (pandas: "X.1").
+    """
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            header = next(csv.reader(f), [])
+    except (OSError, UnicodeDecodeError):
+        return False
+    return all(h.strip() for h in header) and len(set(header)) == len(header)
+
+def read_stats_csv(path, dtype=None, usecols=None) -> pd.DataFrame:
+    """
+    pd.read_csv for the stat/injury CSVs, parsed by polars when it (and
+    pyarrow, for the hand-off to pandas) is installed. dtype is str (every
+    column text) or {column: str}; usecols is a predicate on column names.
+    """
+    if pl is not None and pa is not None and _polars_safe_header(path):
+        try:
+            header = pl.read_csv(path, n_rows=0).columns
+            columns = [c for c in header if usecols(c)] if usecols else None
+            overrides = None
+            if isinstance(dtype, dict):
+                overrides = {c: pl.Utf8 for c in dtype if c in header}
+            return pl.read_csv(
+                path, columns=columns, infer_schema=dtype is not str,
+                infer_schema_length=None, schema_overrides=overrides,
+                null_values=_CSV_NA_VALUES,
+            ).to_pandas()
+        except pl.exceptions.PolarsError:
+            pass  # ragged rows, ...; pandas copes or raises the usual error
+    return pd.read_csv(path, dtype=dtype, usecols=usecols)
+
+# integrate_* results, keyed by function + args, tagged with the mtimes of the
+# CSVs they were built from so a fresh scrape invalidates them automatically
+_INTEGRATED_CACHE = {}
+
+# The same frames persisted between runs, so a cold start skips the CSV parsing
+# and joins as long as the source CSVs haven't changed since they were built.
+# Kept in the per-user cache dir rather than the working tree, since it is unpickled.
+INTEGRATED_CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.getenv("LOCALAPPDATA") or os.path.expanduser("~/.cache"),
+    "RealSports", "integrated",
+)
+
+# Bump when something _cache_salt can't see changes what the loaders build
+# (Universal_Sports_Analyzer helpers, pandas/polars behaviour, ...). Edits to
+# main.py's own loaders, helpers and lookup tables are picked up on their own.
+CACHE_VERSION = 2
+
+def _stable_repr(value) -> str:
+    """repr() without memory addresses, and with sets/dicts in a fixed order."""
+    if isinstance(value, dict):
+        return "{" + ",".join(sorted(f"{_stable_repr(k)}:{_stable_repr(v)}" for k, v in value.items())) + "}"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(_stable_repr(v) for v in value)) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_stable_repr(v) for v in value) + "]"
+    if isinstance(value, (str, bytes, int, float, bool, type(None), re.Pattern)):
+        return repr(value)
+    if callable(value):
+        return getattr(value, "__qualname__", type(value).__name__)
+    return type(value).__name__
+
+def _cache_salt(fn) -> str:
+    """
+    Digest of what a cached frame depends on besides its CSVs: the code of
+    `fn` and of every main.py function it reaches, plus every module-level
+    table (dict, list, set, regex, constant, ...) any of them reads.
+    """
+    h = hashlib.sha1(f"{CACHE_VERSION}|{pd.__version__}".encode("utf-8"))
+    module_globals = fn.__globals__
+    codes = [fn.__code__]
+    seen_codes = set()
+    seen_names = set()
+    while codes:
+        code = codes.pop()
+        if code in seen_codes:
+            continue
+        seen_codes.add(code)
+        h.update(code.co_code)
+        for const in code.co_consts:
+            if inspect.iscode(const):
+                codes.append(const)  # lambdas/comprehensions nested in it
+            else:
+                h.update(_stable_repr(const).encode("utf-8"))
+        for name in code.co_names:
+            if name in seen_names or name not in module_globals:
+                continue
+            seen_names.add(name)
+            value = module_globals[name]
+            # see through lru_cache / cached_on_csv_mtime wrappers
+            target = inspect.unwrap(value) if callable(value) else value
+            if inspect.isfunction(target):
+                if target.__module__ == fn.__module__:
+                    codes.append(target.__code__)
+            elif not (inspect.ismodule(target) or inspect.isclass(target) or callable(target)):
+                h.update(f"{name}={_stable_repr(target)}".encode("utf-8"))
+    return h.hexdigest()
+
+def _disk_cache_path(key) -> str:
+    digest = hashlib.sha1(repr(key[1]).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(INTEGRATED_CACHE_DIR, f"{key[0]}-{digest}.pkl")
+
+def _load_disk_cache(key, sig):
+    """The persisted frame for `key` if it was built from CSVs matching `sig`, else None."""
+    try:
+        with open(_disk_cache_path(key), "rb") as f:
+            cached_sig, value = pickle.load(f)
+    except Exception:
+        return None  # missing, partial or from an incompatible pandas: rebuild
+    return value if cached_sig == sig else None
+
+def _store_disk_cache(key, sig, value) -> None:
+    if not isinstance(value, pd.DataFrame):
+        return
+    path = _disk_cache_path(key)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(INTEGRATED_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump((sig, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"⚠️ Could not persist {key[0]} cache: {e}")
+
+def _mtime_signature(paths):
+    sig = []
+    for path in paths:
+        try:
+            sig.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            sig.append((path, None))
+    return tuple(sig)
+
+# Player/team key columns: a few thousand players over ~30 teams, so cached
+# frames hold them as category and team_isin/isin_normalized get their codes free
+CATEGORY_KEY_COLUMNS = ("PLAYER", "TEAM", "Player", "Team")
+
+def with_category_keys(df):
+    """df with any CATEGORY_KEY_COLUMNS stored as category dtype."""
+    for col in CATEGORY_KEY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+def cached_on_csv_mtime(csv_paths):
+    """
+    Memoize a DataFrame-building function until any of its input CSVs change.
+    `csv_paths` takes the same arguments as the wrapped function and returns
+    the files it reads. Callers always get a (Copy-on-Write) copy, so they may mutate it.
+    DataFrame results keep their key columns as category (with_category_keys)
+    and are also persisted under INTEGRATED_CACHE_DIR for the next run,
+    tagged with _cache_salt so code or table edits invalidate them too.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            # bind so positional, keyword and defaulted calls share one entry
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__name__, tuple(bound.arguments.items()))
+            sig = _mtime_signature(csv_paths(*args, **kwargs))
+            hit = _INTEGRATED_CACHE.get(key)
+            if hit is None or hit[0] != sig:
+                # a persisted frame must match the code and tables as well as the CSVs
+                disk_sig = (_cache_salt(fn), sig)
+                value = _load_disk_cache(key, disk_sig)
+                if value is None:
+                    value = fn(*args, **kwargs)
+                    if isinstance(value, pd.DataFrame):
+                        value = with_category_keys(value)
+                    _store_disk_cache(key, disk_sig, value)
+                hit = (sig, value)
+                _INTEGRATED_CACHE[key] = hit
+            # under Copy-on-Write a shallow copy is enough: a caller's writes
+            # copy the touched columns instead of reaching the cached frame
+            value = hit[1]
+            return value.copy(deep=False) if isinstance(value, pd.DataFrame) else value.copy()
+        return wrapper
+    return decorator
+
+def drop_injured(stats_df, injured_df, left_on, right_on=None):
+    """
+    Left anti-join: the rows of stats_df whose `left_on` name has no match in
+    injured_df[right_on]. A hash-set membership mask, so no joined frame (and
+    none of the injury report's columns) is ever materialized.
+    """
+    right_on = right_on or left_on
+    healthy = stats_df[~stats_df[left_on].isin(injured_df[right_on].unique())]
+    return healthy.reset_index(drop=True)
+
 # ---------- NHL Integration ----------
 def load_nhl_player_stats(file_path):
-    return pd.read_csv(file_path)
+    return read_stats_csv(file_path, dtype=PLAYER_TEAM_DTYPES_TITLE)
 
 def load_nhl_injury_data(file_path):
-    return pd.read_csv(file_path)
+    return read_stats_csv(file_path, dtype=str)
 
+@cached_on_csv_mtime(lambda player_stats_file, injury_data_file: (
+    os.path.join(BASE_DIR, player_stats_file), os.path.join(BASE_DIR, injury_data_file)))
 def integrate_nhl_data(player_stats_file, injury_data_file):
     stats_path = os.path.join(BASE_DIR, player_stats_file)
     inj_path   = os.path.join(BASE_DIR, injury_data_file)
@@ -489,31 +840,20 @@ def integrate_nhl_data(player_stats_file, injury_data_file):
         return stats_df
     if "playerName" in injuries_df.columns:
         injuries_df.rename(columns={"playerName": "Player"}, inplace=True)
+    injured = injuries_df[injuries_df['injuryStatus'].notna()]
     try:
-        integrated_data = pd.merge(stats_df, injuries_df, how='left', on='Player')
+        integrated_data = drop_injured(stats_df, injured, 'Player')
     except Exception as e:
         print("Merge error for NHL data:", e)
         return stats_df
-    integrated_data = integrated_data[integrated_data['injuryStatus'].isnull()]
     if "Team" not in integrated_data.columns:
         integrated_data["Team"] = stats_df["Team"]
-    integrated_data.columns = [col.strip() for col in integrated_data.columns]
+    integrated_data.columns = integrated_data.columns.str.strip()
     integrated_data = calculate_nhl_per_game_stats(integrated_data)
-    if "GP" in integrated_data.columns:
-        games = pd.to_numeric(integrated_data["GP"], errors='coerce')
-    elif "G" in integrated_data.columns:
-        games = pd.to_numeric(integrated_data["G"], errors='coerce')
-    else:
-        games = pd.Series([1] * len(integrated_data))
     integrated_data = update_traded_players(integrated_data, player_col="Player", team_col="Team")
 
     # normalize playoffs or regular-season names to our abbreviations
-    integrated_data["Team"] = (
-        integrated_data["Team"]
-        .astype(str)
-        .str.strip()
-        .apply(normalize_team_name)
-    )
+    integrated_data["Team"] = normalize_team_series(integrated_data["Team"].astype(str))
     return integrated_data
 
 # ----------------------------
@@ -529,33 +869,37 @@ STAT_CATEGORIES_MLB = {
 def load_and_clean_mlb_stats():
     """Read raw MLB stats CSV, normalize headers & player names."""
     stats_file = os.path.join(BASE_DIR, "mlb_2025_stats.csv")
-    df = pd.read_csv(stats_file)
-
-    # collapse duplicate headers & map to our desired keys
-    df.columns = [clean_header(c) for c in df.columns]
-    df = df.loc[:, ~df.columns.duplicated()]
+    # map the (duplicated, run-together) headers to our keys from the header row
+    # alone, then read just the first column for each key already renamed
+    header = pd.read_csv(stats_file, nrows=0).columns
+    keep = {}
+    for pos, raw in enumerate(header):
+        key = clean_header(raw)
+        if key in DESIRED_MLB_COLS and key not in keep:
+            keep[key] = pos
+    order = sorted(keep, key=keep.get)
+    df = pd.read_csv(stats_file, header=0, names=order, usecols=[keep[k] for k in order])
 
     # ensure all desired columns exist
-    for col in DESIRED_MLB_COLS:
-        if col not in df.columns:
-            df[col] = pd.NA
-    df = df.reindex(columns=DESIRED_MLB_COLS)
+    df = df.reindex(columns=DESIRED_MLB_COLS, fill_value=pd.NA)
 
     # fix names & normalize teams
-    df["PLAYER"] = df["PLAYER"].apply(fix_mlb_player_name)
-    df["TEAM"]   = df["TEAM"].astype(str).apply(normalize_team_name)
+    df["PLAYER"] = fix_mlb_player_names(df["PLAYER"])
+    df["TEAM"] = normalize_team_series(df["TEAM"].astype(str))
     return df
 
 def load_mlb_injuries():
     """Read the scraped mlb_injuries.csv and extract clean player names."""
     inj_file = os.path.join(BASE_DIR, "mlb_injuries.csv")
-    df = pd.read_csv(inj_file)
+    df = read_stats_csv(inj_file, usecols=lambda c: c == "playerName", dtype=str)
     if "playerName" not in df.columns:
         raise RuntimeError("Injury CSV missing 'playerName' column")
     # clean up names just like in the stats
-    df["playerName_clean"] = df["playerName"].apply(fix_mlb_player_name)
+    df["playerName_clean"] = fix_mlb_player_names(df["playerName"])
     return df
 
+@cached_on_csv_mtime(lambda: (
+    os.path.join(BASE_DIR, "mlb_2025_stats.csv"), os.path.join(BASE_DIR, "mlb_injuries.csv")))
 def integrate_mlb_data():
     """
     Combine stats + injuries; drop injured players;
@@ -571,21 +915,18 @@ def integrate_mlb_data():
         return stats_df
 
     # 3) build set of injured names
-    inj_clean = set(inj_df["playerName_clean"].dropna().unique())
+    inj_clean = pd.Series(inj_df["playerName_clean"].dropna().unique(), dtype=object)
 
     # only swap first/last for exactly two‐token names:
-    inj_alt = set()
-    for name in inj_clean:
-        parts = name.split()
-        if len(parts) == 2:
-            first, last = parts
-            inj_alt.add(f"{last} {first}")
+    parts = inj_clean.str.split()
+    two_tok = parts[parts.str.len() == 2]
+    inj_alt = two_tok.str[1] + " " + two_tok.str[0]
 
-    injured = inj_clean.union(inj_alt)
+    injured = pd.Index(inj_clean).union(pd.Index(inj_alt))
 
     # 4) filter them out
     before = len(stats_df)
-    stats_df = stats_df[~stats_df["PLAYER"].isin(injured)].copy()
+    stats_df = stats_df[~stats_df["PLAYER"].isin(injured)]
     # dropped = before - len(stats_df)  # no longer printed
 
     # 5) numeric‐ify the rest (drop any values that can’t convert)
@@ -601,18 +942,19 @@ def integrate_mlb_data():
 
 # ---------- NBA Integration ----------
 def load_nba_player_stats(file_path):
-    return pd.read_csv(file_path)
+    return read_stats_csv(file_path, dtype=PLAYER_TEAM_DTYPES)
 
 def load_nba_injury_report(file_path):
-    return pd.read_csv(file_path)
+    return read_stats_csv(file_path, dtype=str)
 
 def merge_nba_stats_with_injuries(stats_df, injuries_df):
     stats_df['PLAYER'] = stats_df['PLAYER'].str.strip()
     injuries_df['playerName'] = injuries_df['playerName'].str.strip()
-    merged_df = pd.merge(stats_df, injuries_df, left_on='PLAYER', right_on='playerName', how='left')
-    healthy_players_df = merged_df[merged_df['injury'].isnull()]
-    return healthy_players_df
+    injured = injuries_df[injuries_df['injury'].notna()]
+    return drop_injured(stats_df, injured, 'PLAYER', 'playerName')
 
+@cached_on_csv_mtime(lambda player_stats_file, injury_report_file: (
+    os.path.join(BASE_DIR, "NBA", player_stats_file), os.path.join(BASE_DIR, "NBA", injury_report_file)))
 def integrate_nba_data(player_stats_file, injury_report_file):
     nba_stats_path = os.path.join(BASE_DIR, "NBA", player_stats_file)
     nba_injuries_path = os.path.join(BASE_DIR, "NBA", injury_report_file)
@@ -625,11 +967,13 @@ def integrate_nba_data(player_stats_file, injury_report_file):
 # ---------- WNBA Integration ----------
 def load_wnba_player_stats(file_path):
     """Load the WNBA stats CSV produced by your scraper."""
-    return pd.read_csv(file_path)
+    return read_stats_csv(file_path, dtype=PLAYER_TEAM_DTYPES)
 
+@cached_on_csv_mtime(lambda player_stats_file="wnba_player_stats.csv": (
+    os.path.join(BASE_DIR, player_stats_file), os.path.join(BASE_DIR, "wnba_injuries.csv")))
 def integrate_wnba_data(player_stats_file="wnba_player_stats.csv"):
     stats_path = os.path.join(BASE_DIR, player_stats_file)
-    df = pd.read_csv(stats_path)
+    df = load_wnba_player_stats(stats_path)
 
     # normalize headers
     df.columns = df.columns.str.strip().str.upper()
@@ -639,16 +983,16 @@ def integrate_wnba_data(player_stats_file="wnba_player_stats.csv"):
 
     # now your STAT_CATEGORIES_WNBA = {"3PM":"3PM", …} will always find a 3PM column
     df["PLAYER"] = df["PLAYER"].str.strip()
-    df["TEAM"]   = df["TEAM"].str.strip().apply(normalize_team_name)
+    df["TEAM"]   = normalize_team_series(df["TEAM"])
 
     # --- Injury filtering ---
     inj_path = os.path.join(BASE_DIR, "wnba_injuries.csv")
     if os.path.exists(inj_path):
-        df_inj = pd.read_csv(inj_path)
+        df_inj = read_stats_csv(inj_path, usecols=lambda c: c == "playerName", dtype=str)
         if "playerName" in df_inj.columns:
             injured = set(df_inj["playerName"].astype(str).str.strip().unique())
             before = len(df)
-            df = df[~df["PLAYER"].isin(injured)].copy()
+            df = df[~df["PLAYER"].isin(injured)]
             dropped = before - len(df)
             #print(f"🔍 Dropped {dropped} injured WNBA players")
         else:
@@ -659,17 +1003,19 @@ def integrate_wnba_data(player_stats_file="wnba_player_stats.csv"):
     return df
 
 # ---------- CBB Integration ----------
+@cached_on_csv_mtime(lambda player_stats_file="cbb_players_stats.csv", injury_data_file="cbb_injuries.csv": (
+    os.path.join(BASE_DIR, player_stats_file), os.path.join(BASE_DIR, injury_data_file)))
 def integrate_cbb_data(player_stats_file="cbb_players_stats.csv", injury_data_file="cbb_injuries.csv"):
     stats_path = os.path.join(BASE_DIR, player_stats_file)
     inj_path = os.path.join(BASE_DIR, injury_data_file)
     print(f"Loading player stats from: {stats_path}")
     try:
-        stats_df = pd.read_csv(stats_path)
+        stats_df = read_stats_csv(stats_path, dtype=PLAYER_TEAM_DTYPES_TITLE)
     except FileNotFoundError:
         print(f"Error: The file {stats_path} was not found.")
         return pd.DataFrame()
     try:
-        injuries_df = pd.read_csv(inj_path)
+        injuries_df = read_stats_csv(inj_path, dtype=str)
     except FileNotFoundError:
         print(f"Error: The file {inj_path} was not found.")
         return stats_df
@@ -679,34 +1025,35 @@ def integrate_cbb_data(player_stats_file="cbb_players_stats.csv", injury_data_fi
         injuries_df.rename(columns={"col_0": "Player"}, inplace=True)
     if "injuryStatus" not in injuries_df.columns and "col_2" in injuries_df.columns:
         injuries_df.rename(columns={"col_2": "injuryStatus"}, inplace=True)
+    if "injuryStatus" in injuries_df.columns:
+        out = injuries_df["injuryStatus"].str.contains(
+            r"out (?:indefinitely|for season)", case=False, na=False, regex=True
+        )
+        injured = injuries_df[out]
+    else:
+        injured = injuries_df.iloc[0:0]
     try:
-        integrated_data = pd.merge(stats_df, injuries_df, how='left', on='Player')
+        integrated_data = drop_injured(stats_df, injured, 'Player')
     except Exception as e:
         print("Merge error for CBB data:", e)
         return stats_df
-    if "injuryStatus" in integrated_data.columns:
-        mask = (
-            integrated_data["injuryStatus"].fillna("")
-            .str.lower()
-            .str.contains("out indefinitely") |
-            integrated_data["injuryStatus"].fillna("")
-            .str.lower()
-            .str.contains("out for season")
-        )
-        integrated_data = integrated_data[~mask]
     if "Team" not in integrated_data.columns:
         integrated_data["Team"] = stats_df["Team"]
-    integrated_data.columns = [col.strip() for col in integrated_data.columns]
+    integrated_data.columns = integrated_data.columns.str.strip()
     integrated_data = update_traded_players(integrated_data, player_col="Player", team_col="Team")
     return integrated_data
 
 # ---------- Summer League Integration ----------
+# lookup keys are lowercased with dots & apostrophes dropped
+_DROPCHARS = str.maketrans("", "", ".'")
+
 # normalize the keys once
 _SNBA_NAME_OVERRIDES = {
-    key.lower().replace(".", "").replace("'", "").strip(): val
+    key.translate(_DROPCHARS).lower().strip(): val
     for key, val in _raw_snba_overrides.items()
 }
 
+@functools.lru_cache(maxsize=4096)
 def fix_snba_player_name(raw: str) -> str:
     """
     Normalize and correct raw Summer League player names
@@ -714,7 +1061,7 @@ def fix_snba_player_name(raw: str) -> str:
     """
     name = raw or ""
     # build our lookup key: lowercase, drop dots & apostrophes, strip whitespace
-    key = name.lower().replace(".", "").replace("'", "").strip()
+    key = name.translate(_DROPCHARS).lower().strip()
 
     # 1) if we have a manual override, use it
     if key in _SNBA_NAME_OVERRIDES:
@@ -723,10 +1070,20 @@ def fix_snba_player_name(raw: str) -> str:
     # 2) otherwise title-case each part
     return " ".join(part.capitalize() for part in name.split())
 
+def fix_snba_player_names(names: pd.Series) -> pd.Series:
+    """fix_snba_player_name for a whole (string) column."""
+    key = names.str.translate(_DROPCHARS).str.lower().str.strip()
+    titled = (
+        names.str.split().str.join(" ")
+             .str.replace(r"\S+", lambda m: m.group(0).capitalize(), regex=True)
+    )
+    return key.map(_SNBA_NAME_OVERRIDES).fillna(titled)
+
+@cached_on_csv_mtime(lambda: (os.path.join(BASE_DIR, "summer_league_stats.csv"),))
 def load_summer_league_stats():
     path = os.path.join(BASE_DIR, "summer_league_stats.csv")
     try:
-        df = pd.read_csv(path)
+        df = read_stats_csv(path, dtype=PLAYER_TEAM_DTYPES)
     except FileNotFoundError:
         print(f"❌ Summer League stats not found at {path}")
         return pd.DataFrame()
@@ -745,13 +1102,50 @@ def load_summer_league_stats():
         df["TEAM"] = ""
 
     # **NEW: fix SNBA names**
-    df["PLAYER"] = df["PLAYER"].astype(str).apply(fix_snba_player_name)
+    df["PLAYER"] = fix_snba_player_names(df["PLAYER"].astype(str))
 
     df["PLAYER"] = df["PLAYER"].str.strip()
     df["TEAM"]   = df["TEAM"].str.strip()
     return df
 
 
+# The integrated frame for each sport, built with the same files the analyzers use
+SPORT_LOADERS = {
+    "NBA":  lambda: integrate_nba_data("nba_player_stats.csv", "nba_injury_report.csv"),
+    "NHL":  lambda: integrate_nhl_data("nhl_player_stats.csv", "nhl_injuries.csv"),
+    "MLB":  integrate_mlb_data,
+    "WNBA": lambda: integrate_wnba_data("wnba_player_stats.csv"),
+    "CBB":  lambda: integrate_cbb_data("cbb_players_stats.csv", "cbb_injuries.csv"),
+    "SNBA": load_summer_league_stats,
+}
+
+def get_sport_frame(sport: str) -> pd.DataFrame:
+    """
+    The integrated frame for `sport`. The loaders are mtime-cached, so repeat
+    calls (e.g. picking the same sport again in the menu) are just copies until
+    a refresh (such as the big scraper) rewrites the source CSVs.
+    """
+    return SPORT_LOADERS[sport]()
+
+def preload_sport_frames(sports=None) -> dict:
+    """
+    Build the integrated frames for `sports` (default: all) concurrently.
+    The loaders are independent and mostly CSV I/O, so running them on
+    threads overlaps the reads; results also land in the mtime cache, so the
+    analyzers' own integrate_* calls afterwards are just copies.
+    """
+    sports = [s for s in (sports or SPORT_LOADERS) if s in SPORT_LOADERS]
+    if not sports:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(sports)) as ex:
+        futures = {sport: ex.submit(SPORT_LOADERS[sport]) for sport in sports}
+    frames = {}
+    for sport, fut in futures.items():
+        try:
+            frames[sport] = fut.result()
+        except Exception as e:
+            print(f"⚠️ Could not preload {sport} data: {e}")
+    return frames
 
 def analyze_summer_league_noninteractive(df, stat_choice, target_value):
     """
@@ -770,7 +1164,7 @@ def analyze_summer_league_noninteractive(df, stat_choice, target_value):
     df = df.dropna(subset=[mapped])
 
     # drop duplicates & banned
-    df = df[~df["PLAYER"].apply(lambda x: is_banned(x, stat_choice))]
+    df = df[~isin_normalized(df["PLAYER"], banned_players_for(stat_choice))]
     df = df.drop_duplicates(subset=["PLAYER"])
 
     # pick a valid team_col (we need _something_ to satisfy categorize_players)
@@ -798,45 +1192,236 @@ def build_query_url(query: str, teams=None) -> str:
     full_query = f"{query} {TIME_PERIOD} {teams_str}"
     return f"{BASE_URL}/ask?q={urllib.parse.quote_plus(full_query)}"
 
+# How many headless Chrome instances fetch_html may keep alive at once
+DRIVER_POOL_SIZE = int(os.getenv("STATMUSE_DRIVER_POOL_SIZE", "2"))
+
+class _DriverPool:
+    """
+    Small pool of reusable headless Chrome drivers for StatMuse scraping.
+    Drivers are created lazily (up to `size`), handed out with acquire(),
+    returned with release(), and thrown away with discard() if they crash.
+    release() and discard() both wake threads waiting in acquire().
+    """
+
+    def __init__(self, size: int):
+        self.size = max(1, size)
+        self._idle = []
+        self._count = 0  # live drivers plus slots reserved while Chrome starts
+        self._cond = threading.Condition()
+
+    def acquire(self) -> webdriver.Chrome:
+        with self._cond:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._count < self.size:
+                    self._count += 1  # reserve a slot while Chrome starts
+                    break
+                self._cond.wait()
+        try:
+            return get_driver()
+        except Exception:
+            with self._cond:
+                self._count -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, drv: webdriver.Chrome) -> None:
+        with self._cond:
+            self._idle.append(drv)
+            self._cond.notify()
+
+    def discard(self, drv: webdriver.Chrome) -> None:
+        with self._cond:
+            self._count -= 1
+            self._cond.notify()
+        try:
+            drv.quit()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        with self._cond:
+            drivers, self._idle = self._idle, []
+            self._count -= len(drivers)
+            self._cond.notify_all()
+        for drv in drivers:
+            try:
+                drv.quit()
+            except Exception:
+                pass
+
+_DRIVER_POOL = _DriverPool(DRIVER_POOL_SIZE)
+atexit.register(_DRIVER_POOL.close)
+
+# Plain HTTP session for the fast path: StatMuse usually renders the answer
+# table server-side, so Chrome is only needed when the response has no table.
+STATMUSE_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+SESSION = requests.Session()
+SESSION.headers.update(STATMUSE_HEADERS)
+
+def fetch_html_requests(url: str) -> str:
+    """Plain GET of a StatMuse page; returns "" unless the response contains a table."""
+    try:
+        r = SESSION.get(url, timeout=15)
+    except requests.RequestException:
+        return ""
+    # StatMuse serves UTF-8; setting it skips requests' charset detection on r.text
+    r.encoding = "utf-8"
+    if r.ok and "<table" in r.text:
+        return r.text
+    return ""
+
+# Rendered StatMuse pages are kept on disk for a few minutes, so a batch of rows
+# (or a re-run) asking the same query doesn't go back to the network.
+# STATMUSE_CACHE_TTL=0 turns the cache off.
+HTML_CACHE_DIR = os.path.join(PSP_FOLDER, "_html_cache")
+HTML_CACHE_TTL = int(os.getenv("STATMUSE_CACHE_TTL", "600"))
+
+def _html_cache_path(url: str) -> str:
+    return os.path.join(HTML_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html")
+
+def read_html_cache(url: str) -> str:
+    """Cached page for `url` if it was written within HTML_CACHE_TTL seconds, else ""."""
+    if HTML_CACHE_TTL <= 0:
+        return ""
+    path = _html_cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > HTML_CACHE_TTL:
+            return ""
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+def write_html_cache(url: str, html: str) -> None:
+    """Store a page that has a table, via temp file + os.replace. Callers skip timed-out renders."""
+    if HTML_CACHE_TTL <= 0 or "<table" not in html:
+        return
+    path = _html_cache_path(url)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(HTML_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(html)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ Could not cache StatMuse page for {url}: {e}")
+
+# Pages rendered ahead of time by prefetch_psp_pages(), keyed by URL.
+# fetch_html() hands each one out once before falling back to a live render;
+# each prefetch starts from an empty dict so unclaimed pages never outlive a run.
+_PREFETCHED_HTML: dict[str, str] = {}
+
+# One worker thread per pooled driver so async fetches never queue on the pool
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=DRIVER_POOL_SIZE)
+atexit.register(_FETCH_EXECUTOR.shutdown, wait=False)
+
 def fetch_html(url: str) -> str:
     """Fetch fully-rendered HTML for the StatMuse query, but never block indefinitely."""
-    chrome_opts = Options()
-    chrome_opts.add_argument("--headless")
-    chrome_opts.add_argument("--no-sandbox")
-    chrome_opts.add_argument("--disable-dev-shm-usage")
-
-    # instantiate a fresh headless driver each call  [oai_citation:0‡reddit.com](https://www.reddit.com/r/learnpython/comments/vvpsdl/timeout_exception_while_using_selenium/?utm_source=chatgpt.com)
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=chrome_opts
-    )
+    html = _PREFETCHED_HTML.pop(url, None) or read_html_cache(url)
+    if html:
+        return html
+    html = fetch_html_requests(url)
+    if html:
+        write_html_cache(url, html)
+        return html
+    for _attempt in range(2):
+        driver = _DRIVER_POOL.acquire()
+        healthy = False
+        rendered = True
+        try:
+            driver.get(url)
+            try:
+                # wait up to 20s for at least one row in the table
+                WebDriverWait(driver, 20).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr"))
+                )
+            except TimeoutException:
+                # if no rows appear in time, log and continue with whatever we have
+                print(f"⚠️ Timeout waiting for table rows on {url}. Proceeding anyway.")
+                rendered = False
+            html = driver.page_source
+            healthy = True
+        except Exception as e:
+            # crashed or wedged browser (WebDriverException, or urllib3/socket
+            # errors once chromedriver is gone): drop it and retry once with a fresh one
+            print(f"⚠️ Chrome driver failed on {url}: {e}")
+            continue
+        finally:
+            if healthy:
+                _DRIVER_POOL.release(driver)
+            else:
+                _DRIVER_POOL.discard(driver)
+        if rendered:
+            write_html_cache(url, html)  # a timed-out render may be an empty table shell
+        return html
+    return ""
 
-    driver.get(url)
-    try:
-        # wait up to 20s for at least one row in the table  [oai_citation:1‡selenium-python.readthedocs.io](https://selenium-python.readthedocs.io/_sources/waits.rst.txt?utm_source=chatgpt.com) [oai_citation:2‡stackoverflow.com](https://stackoverflow.com/questions/56797263/my-selenium-program-fails-to-find-element)
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr"))
-        )
-    except TimeoutException:
-        # if no rows appear in time, log and continue with whatever we have  [oai_citation:3‡browserstack.com](https://www.browserstack.com/guide/understanding-selenium-timeouts?utm_source=chatgpt.com) [oai_citation:4‡browserstack.com](https://www.browserstack.com/guide/selenium-wait-commands-using-python?utm_source=chatgpt.com)
-        print(f"⚠️ Timeout waiting for table rows on {url}. Proceeding anyway.")
-    finally:
-        html = driver.page_source
-        driver.quit()  # always quit to avoid orphaned processes  [oai_citation:5‡frugaltesting.com](https://www.frugaltesting.com/blog/exception-handling-in-selenium-a-comprehensive-guide?utm_source=chatgpt.com)
+def _cell_text(el) -> str:
+    # same text as bs4's get_text(strip=True): every text node stripped, then joined
+    return "".join(t.strip() for t in el.itertext())
 
-    return html
+def _table_frame(headers: list, rows) -> pd.DataFrame:
+    """
+    DataFrame from an iterable of cell lists, filled column by column.
+    Rows whose length doesn't match the headers are skipped (malformed); a
+    repeated header keeps its last cell, same as dict(zip(headers, cells)).
+    """
+    columns = [[] for _ in headers]
+    for cells in rows:
+        if len(cells) != len(headers):
+            continue  # skip malformed rows
+        for col, cell in zip(columns, cells):
+            col.append(cell)
+    return pd.DataFrame(dict(zip(headers, columns)))
 
-def parse_table(html_content: str) -> list[dict]:
+def parse_table(html_content: str) -> pd.DataFrame:
     """
-    Extracts the first <table> from the HTML and returns a list of row-dicts.
+    Extracts the first <table> from the HTML as a DataFrame (empty if there is none).
     """
+    if lxml is None:
+        return _parse_table_soup(html_content)
+    try:
+        root = lxml.html.fromstring(html_content) if html_content else None
+    except etree.ParserError:
+        root = None
+    tables = root.xpath("//table") if root is not None else []
+    if not tables:
+        print("❌ No <table> found—cannot scrape PSP data.")
+        return pd.DataFrame()
+    table = tables[0]
+    etree.strip_elements(table, "script", "style", with_tail=False)
+
+    # headers from <thead> or first <tr>
+    thead = table.find(".//thead")
+    if thead is not None:
+        headers = [_cell_text(th).upper() for th in thead.iterfind(".//th")]
+    else:
+        first_row = table.find(".//tr")
+        headers = [_cell_text(c).upper() for c in first_row.xpath(".//th|.//td")]
+
+    # body rows
+    tbody = table.find(".//tbody")
+    rows_iter = tbody.iterfind(".//tr") if tbody is not None else table.findall(".//tr")[1:]
+
+    return _table_frame(headers, ([_cell_text(c) for c in tr.xpath(".//td|.//th")] for tr in rows_iter))
+
+def _parse_table_soup(html_content: str) -> pd.DataFrame:
+    """parse_table() for installs without lxml."""
     soup = BeautifulSoup(html_content, "html.parser")
     table = soup.find("table")
     if not table:
         print("❌ No <table> found—cannot scrape PSP data.")
-        return []
+        return pd.DataFrame()
 
-    # headers from <thead> or first <tr>
     thead = table.find("thead")
     if thead:
         headers = [th.get_text(strip=True).upper() for th in thead.find_all("th")]
@@ -845,36 +1430,78 @@ def parse_table(html_content: str) -> list[dict]:
         headers = [cell.get_text(strip=True).upper() 
                    for cell in first_row.find_all(["th","td"])]
 
-    # body rows
     tbody = table.find("tbody")
     rows_iter = tbody.find_all("tr") if tbody else table.find_all("tr")[1:]
 
-    parsed = []
-    for tr in rows_iter:
-        cells = [td.get_text(strip=True) for td in tr.find_all(["td","th"])]
-        if len(cells) != len(headers):
-            continue  # skip malformed rows
-        parsed.append(dict(zip(headers, cells)))
+    return _table_frame(headers, ([td.get_text(strip=True) for td in tr.find_all(["td","th"])] for tr in rows_iter))
 
-    return parsed
+async def fetch_html_async(url: str, sem=None) -> str:
+    """fetch_html() on the shared fetch executor, optionally gated by `sem`."""
+    loop = asyncio.get_running_loop()
+    if sem is None:
+        return await loop.run_in_executor(_FETCH_EXECUTOR, fetch_html, url)
+    async with sem:
+        return await loop.run_in_executor(_FETCH_EXECUTOR, fetch_html, url)
 
-def scrape_statmuse_data(sport: str, stat: str, teams=None) -> list[dict]:
+def statmuse_url(sport: str, stat: str, teams=None) -> str:
+    return build_query_url(f"{stat} leaders {sport.lower()}", teams)
+
+def scrape_statmuse_data(sport: str, stat: str, teams=None) -> pd.DataFrame:
     """
     Scrape StatMuse for "<stat> leaders <sport>" (filtered by `teams` if given).
-    Returns a list of dicts mapping column → value.
+    Returns the answer table as a DataFrame, empty when nothing was scraped.
     """
     # 1) build the URL
-    url = build_query_url(f"{stat} leaders {sport.lower()}", teams)
+    url = statmuse_url(sport, stat, teams)
 
     # 2) fetch the rendered HTML
     html = fetch_html(url)
 
-    # 3) parse it into structured rows
+    # 3) parse it into a frame
     return parse_table(html)
 
+# PSP sports whose rows are scraped live from StatMuse
+PSP_SCRAPE_SPORTS = frozenset({"NHL", "NBA", "MLB", "WNBA", "FC"})
+
+# MLB stat spellings: strikeouts get a blank PSP board, total bases read the TB column
+MLB_STRIKEOUT_STATS   = frozenset({"K", "SO", "STRIKEOUT", "STRIKEOUTS"})
+MLB_TOTAL_BASES_STATS = frozenset({"TB", "TOTAL BASES"})
+
+def rows_sports(rows) -> set:
+    """SPORT_LOADERS keys whose integrated frame some row in `rows` will analyze."""
+    sports = set()
+    for row in rows:
+        sport = row["sport"].upper()
+        if sport in {"SUMMER LEAGUE", "NBA SUMMER LEAGUE"}:
+            sport = "SNBA"
+        if row.get("psp", False) and sport not in {"CBB", "SNBA"}:
+            continue  # scraped live from StatMuse instead
+        sports.add(sport)
+    return sports
+
+async def prefetch_psp_pages(rows) -> None:
+    """
+    Render every StatMuse page the PSP rows in `rows` will ask for, up to
+    DRIVER_POOL_SIZE at a time, so the serial analyzer loop reads them from
+    _PREFETCHED_HTML instead of waiting on Chrome one query at a time.
+    """
+    _PREFETCHED_HTML.clear()  # pages left over from the last batch may be stale
+    urls = list(dict.fromkeys(
+        statmuse_url(row["sport"], row["stat"], row.get("teams", ""))
+        for row in rows
+        if row.get("psp", False) and row["sport"].upper() in PSP_SCRAPE_SPORTS
+    ))
+    if not urls:
+        return
+    sem = asyncio.Semaphore(DRIVER_POOL_SIZE)
+    pages = await asyncio.gather(*(fetch_html_async(u, sem) for u in urls))
+    _PREFETCHED_HTML.update((u, html) for u, html in zip(urls, pages) if html)
+
 # near the top of your PSP section, replace any existing clean_name with this:
 
-_suffixes = {"Jr", "Sr", "II", "III", "IV", "V"}
+# "SmithJ" → lowercase letter followed by a capital; and a lone initial token
+_SPLIT_UPPER  = re.compile(r'([a-zà-öø-ÿ])([A-Z])')
+_LONE_INITIAL = re.compile(r"[A-Za-z]\.?")
 
 def clean_name(name: str) -> str:
     """
@@ -885,14 +1512,14 @@ def clean_name(name: str) -> str:
     4) Remove any duplicate tokens (case-insensitive), preserving first occurrence
     """
     # 1) break "SmithJ" → "Smith J"
-    name = re.sub(r'([a-zà-öø-ÿ])([A-Z])', r'\1 \2', name)
+    name = _SPLIT_UPPER.sub(r'\1 \2', name)
 
     parts = name.strip().split()
     seen = set()
     cleaned = []
     for p in parts:
         token = p.rstrip(".")           # 3) strip trailing dot
-        if re.fullmatch(r"[A-Za-z]\.?", p):
+        if _LONE_INITIAL.fullmatch(p):
             continue                    # 2) drop lone initials
         low = token.lower()
         if low in seen:
@@ -900,47 +1527,97 @@ def clean_name(name: str) -> str:
         seen.add(low)
         cleaned.append(token)
     return " ".join(cleaned)
-def analyze_nba_psp(file_path, stat_key):
-    try:
-        df_psp = pd.read_csv(file_path)
-        df_psp.columns = [col.upper() for col in df_psp.columns]
-    except Exception as e:
-        return f"Error reading PSP CSV: {e}"
+
+def clean_names(names: pd.Series) -> pd.Series:
+    """clean_name for a whole (string) column, done with Series.str over the exploded tokens."""
+    parts = (
+        names.reset_index(drop=True)
+             .str.replace(_SPLIT_UPPER, r"\1 \2", regex=True)
+             .str.split()
+             .explode()
+             .dropna()
+    )
+    parts = parts[~parts.str.fullmatch(_LONE_INITIAL)]
+    tokens = pd.DataFrame({"token": parts.str.rstrip(".")})
+    tokens["low"] = tokens["token"].str.lower()
+    tokens = tokens[~tokens.reset_index().duplicated(["index", "low"]).to_numpy()]
+    joined = tokens.groupby(level=0, sort=False)["token"].agg(" ".join)
+    return pd.Series(
+        joined.reindex(range(len(names)), fill_value="").to_numpy(), index=names.index
+    )
+
+NBA_PSP_STATS_FILE    = os.path.join(BASE_DIR, "NBA", "nba_player_stats.csv")
+NBA_PSP_INJURIES_FILE = os.path.join(BASE_DIR, "NBA", "nba_injury_report.csv")
+
+@cached_on_csv_mtime(lambda: (NBA_PSP_STATS_FILE,))
+def load_nba_psp_stats():
+    """nba_player_stats.csv with upper-cased headers, re-read only when the file changes."""
+    df_stats = read_stats_csv(NBA_PSP_STATS_FILE, dtype=PLAYER_TEAM_DTYPES)
+    df_stats.columns = df_stats.columns.str.upper()
+    return df_stats
+
+@cached_on_csv_mtime(lambda: (NBA_PSP_INJURIES_FILE,))
+def nba_injured_names():
+    """Stripped injured-player names from nba_injury_report.csv, rebuilt only when it changes."""
+    df_inj = read_stats_csv(NBA_PSP_INJURIES_FILE, usecols=lambda c: c in ("PLAYER", "playerName"), dtype=str)
+    names = df_inj["PLAYER"] if "PLAYER" in df_inj.columns else df_inj["playerName"]
+    return frozenset(names.str.strip().dropna())
+
+@cached_on_csv_mtime(lambda: (os.path.join(BASE_DIR, "mlb_injuries.csv"),))
+def mlb_injured_names_lower():
+    """Lowercased cleaned names from mlb_injuries.csv, rebuilt only when it changes."""
+    return frozenset(load_mlb_injuries()["playerName_clean"].dropna().str.lower())
+
+def comma_numeric(values: pd.Series) -> pd.Series:
+    """StatMuse numbers like "1,234" as floats (unparseable -> NaN), with a literal comma strip."""
+    if pd.api.types.is_numeric_dtype(values):
+        return pd.to_numeric(values, errors="coerce")
+    return pd.to_numeric(values.astype(str).str.replace(",", "", regex=False), errors="coerce")
+
+def read_psp_csv(file_path):
+    """Load a dumped PSP CSV with upper-cased column names."""
+    df = pd.read_csv(file_path, engine=PSP_CSV_ENGINE, dtype=PSP_NAME_DTYPES)
+    df.columns = df.columns.str.upper()
+    return df
+
+def analyze_nba_psp(df_psp, stat_key):
+    df_psp = df_psp.rename(columns=str.upper)
     try:
-        df_stats = pd.read_csv(os.path.join(BASE_DIR, "NBA", "nba_player_stats.csv"))
-        df_stats.columns = [col.upper() for col in df_stats.columns]
+        df_stats = load_nba_psp_stats()
     except Exception as e:
         return f"Error reading NBA player stats CSV: {e}"
     try:
-        df_inj = pd.read_csv(os.path.join(BASE_DIR, "NBA", "nba_injury_report.csv"))
-        df_inj["PLAYER"] = df_inj["PLAYER"].str.strip() if "PLAYER" in df_inj.columns else df_inj["playerName"].str.strip()
-        injured_names = set(df_inj["PLAYER"].dropna().unique())
+        injured_names = nba_injured_names()
     except Exception as e:
         return f"Error loading or processing NBA injuries CSV: {e}"
-    try:
-        df_merged = pd.merge(df_psp, df_stats, left_on="NAME", right_on="PLAYER", how="left", suffixes=('_psp', '_stats'))
-    except Exception as e:
-        return f"Error merging PSP and NBA stats: {e}"
-    df_merged = df_merged[~df_merged["NAME"].isin(injured_names)]
+    # the stat normally comes from the PSP scrape itself; only fall back to the
+    # season table (looked up by name) when the scrape doesn't have that column
+    if stat_key not in df_psp.columns and stat_key in df_stats.columns:
+        try:
+            df_psp[stat_key] = df_psp["NAME"].map(df_stats.set_index("PLAYER")[stat_key])
+        except Exception as e:
+            return f"Error merging PSP and NBA stats: {e}"
+    df_merged = df_psp[~df_psp["NAME"].isin(injured_names)]
     if stat_key not in df_merged.columns:
         return f"Stat column '{stat_key}' not found in CSV."
     try:
-        df_merged[stat_key] = pd.to_numeric(df_merged[stat_key].replace({',': ''}, regex=True), errors='coerce')
+        df_merged[stat_key] = comma_numeric(df_merged[stat_key])
     except Exception as e:
         return f"Error converting stat column: {e}"
-    sorted_df = df_merged.sort_values(by=stat_key, ascending=False).reset_index(drop=True)
+    # only the top 9 are ever shown, so a partial sort is enough
+    sorted_df = df_merged.nlargest(9, stat_key).reset_index(drop=True)
     yellow = sorted_df.iloc[0:3]
     green = sorted_df.iloc[3:6]
     red = sorted_df.iloc[6:9]
     player_col = "NAME" if "NAME" in sorted_df.columns else None
     if player_col is None:
         return "Player column not found in CSV."
-    output = f"🟢 {', '.join(str(x) for x in green[player_col].tolist() if not is_banned(str(x), stat_key))}\n"
-    output += f"🟡 {', '.join(str(x) for x in yellow[player_col].tolist() if not is_banned(str(x), stat_key))}\n"
-    output += f"🔴 {', '.join(str(x) for x in red[player_col].tolist() if not is_banned(str(x), stat_key))}"
+    output = f"🟢 {', '.join(str(x) for x in drop_banned(green[player_col].tolist(), stat_key))}\n"
+    output += f"🟡 {', '.join(str(x) for x in drop_banned(yellow[player_col].tolist(), stat_key))}\n"
+    output += f"🔴 {', '.join(str(x) for x in drop_banned(red[player_col].tolist(), stat_key))}"
     return output
 
-def analyze_nhl_psp(file_path, stat_key):
+def analyze_nhl_psp(df, stat_key):
     NHL_PSP_COLUMN_MAP = {
         "SHOTS": "S",
         "POINTS": "P",
@@ -950,19 +1627,17 @@ def analyze_nhl_psp(file_path, stat_key):
         "SAVES": "SV"
     }
     mapped_stat = NHL_PSP_COLUMN_MAP.get(stat_key, stat_key)
-    try:
-        df = pd.read_csv(file_path)
-    except Exception as e:
-        return f"Error reading PSP CSV: {e}"
-    df.columns = [col.upper() for col in df.columns]
+    df = df.rename(columns=str.upper)
     if mapped_stat not in df.columns:
         return f"Error: Column '{mapped_stat}' not found in PSP CSV. Available columns: {df.columns.tolist()}"
     try:
-        df[mapped_stat] = pd.to_numeric(df[mapped_stat].replace({',': ''}, regex=True), errors='coerce')
+        df[mapped_stat] = comma_numeric(df[mapped_stat])
     except Exception as e:
         return f"Error converting stat column: {e}"
-    sorted_df = df.sort_values(by=mapped_stat, ascending=False).reset_index(drop=True)
-    if len(sorted_df) >= 15:
+    # big boards skip ahead (rows 5-8 and 12-15), so keep the top 15 there, else the top 9
+    deep = len(df) >= 15
+    sorted_df = df.nlargest(15 if deep else 9, mapped_stat).reset_index(drop=True)
+    if deep:
         yellow = sorted_df.iloc[0:3]
         green = sorted_df.iloc[5:8]
         red = sorted_df.iloc[12:15]
@@ -973,28 +1648,26 @@ def analyze_nhl_psp(file_path, stat_key):
     player_col = "NAME" if "NAME" in sorted_df.columns else None
     if player_col is None:
         return "Player column not found in CSV."
-    green_list = [x for x in green[player_col].tolist() if not is_banned(str(x), stat_key)]
-    yellow_list = [x for x in yellow[player_col].tolist() if not is_banned(str(x), stat_key)]
-    red_list = [x for x in red[player_col].tolist() if not is_banned(str(x), stat_key)]
+    green_list = drop_banned(green[player_col].tolist(), stat_key)
+    yellow_list = drop_banned(yellow[player_col].tolist(), stat_key)
+    red_list = drop_banned(red[player_col].tolist(), stat_key)
     output = f"🟢 {', '.join(str(x) for x in green_list)}\n"
     output += f"🟡 {', '.join(str(x) for x in yellow_list)}\n"
     output += f"🔴 {', '.join(str(x) for x in red_list)}"
     return output
 
-def analyze_mlb_psp(file_path, stat_key, teams):
-    # 1) Load PSP data
-    df = pd.read_csv(file_path)
-    df.columns = [c.upper() for c in df.columns]
-    df[stat_key] = pd.to_numeric(df[stat_key].replace({',': ''}, regex=True), errors='coerce')
+def analyze_mlb_psp(df, stat_key, teams):
+    # 1) Normalize the PSP columns (works on a copy, the caller's frame is untouched)
+    df = df.rename(columns=str.upper)
+    df[stat_key] = comma_numeric(df[stat_key])
 
     # 2) Filter out injured players
     try:
-        inj_df       = load_mlb_injuries()
-        # make a lowercase set for matching:
-        injured_set  = {n.lower() for n in inj_df["playerName_clean"].dropna()}
+        # lowercase set for matching, built once per injuries file
+        injured_set  = mlb_injured_names_lower()
 
         # compute cleaned names (preserves Title Case)
-        df["NAME_CLEAN"] = df["NAME"].apply(fix_mlb_player_name)
+        df["NAME_CLEAN"] = fix_mlb_player_names(df["NAME"])
 
         # filter by lowercase comparison
         df = df[~df["NAME_CLEAN"].str.lower().isin(injured_set)]
@@ -1011,8 +1684,11 @@ def analyze_mlb_psp(file_path, stat_key, teams):
         team_list = teams if isinstance(teams, list) else [t.strip().upper() for t in str(teams).split(",")]
         df = df[df["TEAM"].str.upper().isin(team_list)]
 
-    # 4) Sort & slice
-    sorted_df = df.sort_values(by=stat_key, ascending=False).reset_index(drop=True)
+    # 3a) rows without a player name can't be picked
+    df = df[df["NAME"].notna() & (df["NAME"].astype(str).str.strip() != "")]
+
+    # 4) Sort & slice (partial sort: only the top 9 are shown)
+    sorted_df = df.nlargest(9, stat_key).reset_index(drop=True)
     yellow = sorted_df.iloc[0:3]
     green  = sorted_df.iloc[3:6]
     red    = sorted_df.iloc[6:9]
@@ -1027,28 +1703,30 @@ def analyze_mlb_psp(file_path, stat_key, teams):
         f"🔴 {names(red)}"
     )
 
-def analyze_wnba_psp(file_path, stat_key):
+def analyze_wnba_psp(df, stat_key):
     """
-    Reads the StatMuse–dumped CSV at file_path, cleans names,
+    Takes the scraped StatMuse rows as a DataFrame, cleans names,
     drops banned players, sorts by stat_key desc, and slices into 🟢/🟡/🔴 buckets.
     """
-    # 1) Load
-    df = pd.read_csv(file_path)
-    df.columns = [c.upper() for c in df.columns]
+    # 1) Normalize columns
+    df = df.rename(columns=str.upper)
 
     # 2) Clean up the NAME column (restore your original logic)
     #    so "Sonia CitronS. Citron" → "Sonia Citron"
-    df["NAME"] = df["NAME"].astype(str).apply(clean_name)
+    names = df["NAME"]
+    df["NAME"] = clean_names(names.astype(str)).where(names.notna())
 
     # 3) Ensure stat column is numeric and drop rows where stat or NAME is missing
-    df[stat_key] = pd.to_numeric(df[stat_key].replace({',': ''}, regex=True), errors='coerce')
+    #    (scraped rows arrive in memory, so a missing name is "" rather than NaN)
+    df[stat_key] = comma_numeric(df[stat_key])
     df = df.dropna(subset=[stat_key, "NAME"])
+    df = df[df["NAME"].str.strip() != ""]
 
     # 4) Drop banned players
-    df = df[~df["NAME"].apply(lambda nm: is_banned(nm, stat_key))]
+    df = df[~isin_normalized(df["NAME"], banned_players_for(stat_key))]
 
-    # 5) Sort & slice into buckets
-    sorted_df = df.sort_values(by=stat_key, ascending=False).reset_index(drop=True)
+    # 5) Sort & slice into buckets (partial sort: only the top 9 are shown)
+    sorted_df = df.nlargest(9, stat_key).reset_index(drop=True)
     top3 = sorted_df.iloc[0:3]["NAME"].tolist()
     mid3 = sorted_df.iloc[3:6]["NAME"].tolist()
     bot3 = sorted_df.iloc[6:9]["NAME"].tolist()
@@ -1060,8 +1738,29 @@ def analyze_wnba_psp(file_path, stat_key):
         f"🔴 {', '.join(bot3)}"
     )
 
-def analyze_nba_psp_notion(file_path, stat_key):
-    return analyze_nba_psp(file_path, stat_key)
+def analyze_nba_psp_notion(df, stat_key):
+    return analyze_nba_psp(df, stat_key)
+
+# Path-based entry points for callers that still hand over a dumped PSP CSV.
+def analyze_nba_psp_from_path(file_path, stat_key):
+    try:
+        df = read_psp_csv(file_path)
+    except Exception as e:
+        return f"Error reading PSP CSV: {e}"
+    return analyze_nba_psp(df, stat_key)
+
+def analyze_nhl_psp_from_path(file_path, stat_key):
+    try:
+        df = read_psp_csv(file_path)
+    except Exception as e:
+        return f"Error reading PSP CSV: {e}"
+    return analyze_nhl_psp(df, stat_key)
+
+def analyze_mlb_psp_from_path(file_path, stat_key, teams):
+    return analyze_mlb_psp(read_psp_csv(file_path), stat_key, teams)
+
+def analyze_wnba_psp_from_path(file_path, stat_key):
+    return analyze_wnba_psp(read_psp_csv(file_path), stat_key)
 
 # ----------------------------
 # Missing Functions for MLB and NHL Interactive Analysis
@@ -1078,11 +1777,9 @@ def analyze_mlb_noninteractive(df, teams, stat_choice, banned_stat=None):
             if isinstance(teams, str)
             else [normalize_team_name(t) for t in teams]
         )
-        filtered_df = df[df["TEAM"].astype(str)
-                          .apply(normalize_team_name)
-                          .isin(team_list)].copy()
+        filtered_df = df[team_isin(df["TEAM"], team_list)]
     else:
-        filtered_df = df.copy()
+        filtered_df = df.copy(deep=False)
 
     if filtered_df.empty:
         return "❌ No matching teams found."
@@ -1096,12 +1793,11 @@ def analyze_mlb_noninteractive(df, teams, stat_choice, banned_stat=None):
     except Exception as e:
         return f"Error converting stat column: {e}"
 
-    # 3) Sort, drop duplicates and banned players
-    sorted_df = (filtered_df
-                 .sort_values(by=mapped_stat, ascending=False)
-                 .drop_duplicates(subset=["PLAYER"]))
-    sorted_df = sorted_df[~sorted_df["PLAYER"].apply(lambda x: is_banned(x, stat_choice))]
-    non_banned = sorted_df["PLAYER"].tolist()
+    # 3) Drop banned players, then take the best rows; over-fetch by the
+    # repeated rows so 9 distinct players survive drop_duplicates
+    eligible = filtered_df[~isin_normalized(filtered_df["PLAYER"], banned_players_for(stat_choice))]
+    extra = int(eligible["PLAYER"].duplicated().sum())
+    non_banned = eligible.nlargest(9 + extra, mapped_stat)["PLAYER"].drop_duplicates().tolist()
 
     # 4) Take the top 9 (or fewer) and slice into buckets
     players_to_use = non_banned[:9]
@@ -1111,11 +1807,9 @@ def analyze_mlb_noninteractive(df, teams, stat_choice, banned_stat=None):
 
     # ──────────────────────────────────────────────────────────────────────────
     # 5) Bump any “stud” into the 🟡 Favorite bucket
-    studs_lower = {p.lower() for p in PERMANENT_YELLOW_PLAYERS}
-
     # move them out of green and into front of yellow
     for stud in list(green_list):
-        if stud.lower() in studs_lower:
+        if stud.lower() in PERMANENT_YELLOW_LOWER:
             green_list.remove(stud)
             if stud not in yellow_list:
                 yellow_list.insert(0, stud)
@@ -1139,22 +1833,16 @@ def analyze_mlb_noninteractive(df, teams, stat_choice, banned_stat=None):
 def analyze_nhl_noninteractive(df, teams, stat_choice, target_value=None, banned_stat=None):
     # normalize the teams list too
     team_list = [normalize_team_name(t) for t in teams]  # teams is already a list
-    filtered_df = df[
-        df["Team"]
-        .astype(str)
-        .str.upper()
-        .apply(normalize_team_name)
-        .isin(team_list)
-    ].copy()
+    filtered_df = df[team_isin(df["Team"], team_list)]
 
     if filtered_df.empty:
         return "❌ No matching teams found."
 
     # per-game adjustment
     if stat_choice in ["ASSISTS", "POINTS", "S"]:
-        df_mode = calculate_nhl_per_game_stats(filtered_df.copy())
+        df_mode = calculate_nhl_per_game_stats(filtered_df)
     else:
-        df_mode = filtered_df.copy()
+        df_mode = filtered_df
 
     mapped_stat = STAT_CATEGORIES_NHL.get(stat_choice)
     if not mapped_stat:
@@ -1173,9 +1861,10 @@ def analyze_nhl_noninteractive(df, teams, stat_choice, target_value=None, banned
             stat_for_ban=stat_choice
         )
 
-    # default slice
-    sorted_df = df_mode.sort_values(by=mapped_stat, ascending=False)
-    players = sorted_df["Player"].drop_duplicates().tolist()
+    # default slice; over-fetch by the repeated rows (traded players) so 9
+    # distinct players survive drop_duplicates
+    extra = int(df_mode["Player"].duplicated().sum())
+    players = df_mode.nlargest(9 + extra, mapped_stat)["Player"].drop_duplicates().tolist()
     yellow, green, red = players[:3], players[3:6], players[6:9]
     return f"🟢 {', '.join(green)}\n🟡 {', '.join(yellow)}\n🔴 {', '.join(red)}"
 
@@ -1188,6 +1877,9 @@ PSP_DATABASE_ID = "1ac71b1c663e808e9110eee23057de0e"
 POLL_PAGE_ID = "18e71b1c663e80cdb8a0fe5e8aeee5a9"
 
 client = Client(auth=NOTION_TOKEN)
+# httpx-based client for the async writers; they all run on run_async()'s one
+# event loop, so its connection pool is reused across calls
+aclient = AsyncClient(auth=NOTION_TOKEN)
 
 def fetch_unprocessed_rows(database_id):
     try:
@@ -1262,41 +1954,43 @@ def fetch_unprocessed_rows(database_id):
             "stat": stat,
             "target": target_value,
             "created_time": created_time,
-            "Order": order_val,
+            # unnumbered rows sort last
+            "Order": order_val if order_val is not None else sys.maxsize,
             "psp": is_psp
         })
-    rows.sort(key=lambda x: float(x.get("Order") if x.get("Order") is not None else float('inf')))
+    rows.sort(key=operator.itemgetter("Order"))
     return rows
 
+# Poll page block templates; the divider has no per-entry content, so one dict serves every entry
+_DIVIDER_BLOCK = {"object": "block", "type": "divider", "divider": {}}
+
+def _paragraph_block(text: str) -> dict:
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [{
+                "type": "text",
+                "text": {"content": text}
+            }]
+        }
+    }
+
 async def append_poll_entries_to_page(entries):
-    blocks = []
-    for entry in entries:
-        # always coerce title and output to strings (never None)
-        title_text = str(entry.get("title", "") or "")
-        output_text = str(entry.get("output", "") or "")
-
-        blocks.append({
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{
-                    "type": "text",
-                    "text": {"content": title_text}
-                }]
-            }
-        })
-        blocks.append({
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{
-                    "type": "text",
-                    "text": {"content": output_text}
-                }]
-            }
-        })
-        blocks.append({"object": "block", "type": "divider", "divider": {}})
-    # chunking logic unchanged
+    if not entries:
+        return True
+    # title, output, divider per entry; always coerce title and output to strings (never None)
+    blocks = [
+        block
+        for entry in entries
+        for block in (
+            _paragraph_block(str(entry.get("title", "") or "")),
+            _paragraph_block(str(entry.get("output", "") or "")),
+            _DIVIDER_BLOCK,
+        )
+    ]
+    # chunks go out one at a time: Notion appends each to the end of the page,
+    # so concurrent requests could interleave the polls out of order
     max_blocks = 100
     def chunk_list(lst, n):
         for i in range(0, len(lst), n):
@@ -1304,8 +1998,7 @@ async def append_poll_entries_to_page(entries):
 
     for block_chunk in chunk_list(blocks, max_blocks):
         try:
-            await asyncio.to_thread(
-                client.blocks.children.append,
+            await aclient.blocks.children.append(
                 block_id=POLL_PAGE_ID,
                 children=block_chunk
             )
@@ -1316,9 +2009,8 @@ async def append_poll_entries_to_page(entries):
 
 async def mark_row_as_processed(page_id):
     try:
-        await asyncio.to_thread(client.pages.update,
-                                page_id=page_id,
-                                properties={"Processed": {"select": {"name": "Yes"}}})
+        await aclient.pages.update(page_id=page_id,
+                                   properties={"Processed": {"select": {"name": "Yes"}}})
     except Exception as e:
         if "Conflict occurred while saving" in str(e):
             print(f"Conflict error while marking row {page_id} as processed. Retrying...")
@@ -1327,6 +2019,19 @@ async def mark_row_as_processed(page_id):
         else:
             print(f"Error marking row {page_id} as processed: {e}")
 
+# Notion has no batch page-update endpoint, so bulk marking pipelines single
+# updates, a few at a time to stay under its rate limit
+NOTION_CONCURRENCY = int(os.getenv("NOTION_CONCURRENCY", "3"))
+
+async def mark_rows_as_processed(page_ids):
+    sem = asyncio.Semaphore(NOTION_CONCURRENCY)
+
+    async def mark(page_id):
+        async with sem:
+            await mark_row_as_processed(page_id)
+
+    await asyncio.gather(*(mark(page_id) for page_id in page_ids))
+
 def update_psp_files():
     psp_path = os.path.join(REALSPORTS_DIR, "psp_database.py")
     try:
@@ -1335,39 +2040,69 @@ def update_psp_files():
     except Exception as e:
         print("Error running psp_database.py:", e)
 
-def run_universal_sports_analyzer_programmatic(row):
-    sport_upper = row["sport"].upper()
-    teams = row.get("teams", [])
-    if not teams:
-        teams = [team.strip().upper() for team in [row.get("team1", ""), row.get("team2", "")] if team]
-    def parse_target(target):
-        t = target.strip().lower()
-        if t in ["", "none"]:
-            return None
+def write_psp_csv(df_psp, file_path):
+    """
+    Dump a scraped PSP frame to file_path via a temp file + os.replace, so rows
+    analyzed concurrently for the same sport/stat never read a half-written CSV.
+    """
+    tmp_path = f"{file_path}.{threading.get_ident()}.tmp"
+    written = False
+    if pa is not None:
         try:
-            return float(t)
-        except Exception:
-            return None
-    target_val = parse_target(row["target"])
-    
-    if row.get("psp", False):
-        # ─── normalize Notion “teams” into teams_list ────────────────────
-        raw_teams = row.get("teams", [])
-        if isinstance(raw_teams, str):
-            teams_list = [
-                normalize_team_name(t)
-                for t in raw_teams.split(",")
-                if t.strip()
-            ]
-        else:
-            teams_list = [
-                normalize_team_name(t)
-                for t in raw_teams
-            ]
+            pacsv.write_csv(pa.Table.from_pandas(df_psp, preserve_index=False), tmp_path)
+            written = True
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # mixed-type column arrow can't type; pandas writes anything
+    if not written:
+        df_psp.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, file_path)
+
+class ParsedRow(NamedTuple):
+    """The fields of a Notion poll row the analyzers need, parsed once per row."""
+    sport: str               # upper-cased
+    stat: str                # stripped + upper-cased, "" when blank
+    target: Optional[float]  # None when blank/"none"/unparseable
+    raw_teams: object        # Notion "teams" as given (list or comma string)
+    teams: list              # raw_teams through normalize_team_name
+    game_teams: list         # raw_teams, else the team1/team2 columns
+
+def parse_target(target):
+    t = target.strip().lower()
+    if t in ["", "none"]:
+        return None
+    try:
+        return float(t)
+    except Exception:
+        return None
+
+def notion_team_list(raw_teams, normalize=normalize_team_name) -> list:
+    """Notion "teams" (a list, or a comma-separated string) with `normalize` applied to each."""
+    if isinstance(raw_teams, str):
+        return [normalize(t) for t in raw_teams.split(",") if t.strip()]
+    return [normalize(t) for t in raw_teams]
+
+def parse_notion_row(row) -> ParsedRow:
+    raw_teams = row.get("teams", [])
+    game_teams = raw_teams or [
+        team.strip().upper() for team in [row.get("team1", ""), row.get("team2", "")] if team
+    ]
+    return ParsedRow(
+        sport=row["sport"].upper(),
+        stat=row["stat"].strip().upper(),
+        target=parse_target(row["target"]),
+        raw_teams=raw_teams,
+        teams=notion_team_list(raw_teams),
+        game_teams=game_teams,
+    )
 
-        sport_upper = row["sport"].upper()
-        target_val  = parse_target(row["target"])
+def run_universal_sports_analyzer_programmatic(row):
+    p = parse_notion_row(row)
+    sport_upper = p.sport
+    teams = p.game_teams
+    target_val = p.target
+    teams_list = p.teams
 
+    if row.get("psp", False):
         # ─── CBB & SNBA PSP ──────────────────────────
         if sport_upper in {"CBB", "SNBA"}:
             if sport_upper == "CBB":
@@ -1380,20 +2115,14 @@ def run_universal_sports_analyzer_programmatic(row):
                     return "❌ Summer League stats not found."
 
             # 1) map human‐readable stat to actual column
-            human = row["stat"].strip().upper()
+            human = p.stat
             mapped = STAT_CATEGORIES_NBA.get(human)
             if not mapped:
                 return f"❌ Invalid SNBA stat '{human}'. Choose from {list(STAT_CATEGORIES_NBA)}."
 
             # 2) filter by Notion teams (TEAM column is uppercase)
-            teams_raw = row.get("teams", [])
-            teams_list = (
-                [normalize_team_name(t) for t in teams_raw.split(",")] 
-                if isinstance(teams_raw, str) 
-                else [normalize_team_name(t) for t in teams_raw]
-            )
             if teams_list:
-                df = df[df["TEAM"].apply(normalize_team_name).isin(teams_list)]
+                df = df[team_isin(df["TEAM"], teams_list)]
                 if df.empty:
                     return "❌ No SNBA players found for those teams."
 
@@ -1412,62 +2141,43 @@ def run_universal_sports_analyzer_programmatic(row):
                 stat_for_ban=human    # still use human for banning logic
             )
 
-        elif sport_upper in {"NHL", "NBA", "MLB", "WNBA", "FC"}:
-            # Force a fresh StatMuse scrape for NHL, NBA, and MLB PSP rows.
-            data = scrape_statmuse_data(sport_upper, row["stat"], row.get("teams", ""))
-            if not data:
+        elif sport_upper in PSP_SCRAPE_SPORTS:
+            # Force a fresh StatMuse scrape for NHL, NBA, WNBA, and MLB PSP rows (once per row).
+            df_psp = scrape_statmuse_data(sport_upper, row["stat"], p.raw_teams)
+            if df_psp.empty:
                 return f"❌ No PSP data scraped for {sport_upper}."
             file_name = f"{sport_upper.lower()}_{row['stat'].lower().replace(' ', '_')}_psp_data.csv"
             file_path = os.path.join(PSP_FOLDER, file_name)
-            pd.DataFrame(data).to_csv(file_path, index=False)
+            # analyze the scraped frame in memory; the CSV is only an audit dump
+            write_psp_csv(df_psp, file_path)
             if sport_upper == "NHL":
-                stat_key = row["stat"].upper()
-                return analyze_nhl_psp(file_path, stat_key)
+                return analyze_nhl_psp(df_psp, p.stat)
             elif sport_upper == "NBA":
-                stat_key = row["stat"].upper()
+                stat_key = p.stat
                 if stat_key == "FG3M":
                     stat_key = "3PM"
                 if stat_key not in STAT_CATEGORIES_NBA:
                     return f"❌ Invalid NBA stat choice."
-                return analyze_nba_psp_notion(file_path, stat_key)
+                return analyze_nba_psp_notion(df_psp, stat_key)
             elif sport_upper == "WNBA":
-                # 1) scrape fresh from StatMuse
-                data = scrape_statmuse_data(sport_upper, row["stat"], row.get("teams", []))
-                if not data:
-                    return f"❌ No PSP data scraped for WNBA."
-                
-                # 2) save it
-                file_name = f"wnba_{row['stat'].lower().replace(' ', '_')}_psp_data.csv"
-                file_path = os.path.join(PSP_FOLDER, file_name)
-                pd.DataFrame(data).to_csv(file_path, index=False)
-
-                # 3) map your poll-stat to the CSV column
-                stat_key = STAT_CATEGORIES_WNBA.get(row["stat"].upper(), row["stat"].upper())
-
-                # 4) hand off to the PSP analyzer
-                return analyze_wnba_psp(file_path, stat_key)
-            elif sport_upper == "MLB":
-                # fresh StatMuse scrape
-                data = scrape_statmuse_data(sport_upper, row["stat"], row.get("teams", ""))
-                if not data:
-                    return f"❌ No PSP data scraped for {sport_upper}."
-                # write CSV
-                file_name = f"{sport_upper.lower()}_{row['stat'].lower().replace(' ', '_')}_psp_data.csv"
-                file_path = os.path.join(PSP_FOLDER, file_name)
-                pd.DataFrame(data).to_csv(file_path, index=False)
-
-            raw_stat = row["stat"].strip().upper() or "RBI"
+                # map your poll-stat to the CSV column, then hand the scrape
+                # above off to the PSP analyzer
+                stat_key = STAT_CATEGORIES_WNBA.get(p.stat, p.stat)
+                return analyze_wnba_psp(df_psp, stat_key)
+
+            # MLB (and anything else scraped) reuses the scrape above as well
+            raw_stat = p.stat or "RBI"
             # blank output for Strikeouts/K
-            if raw_stat in {"K", "SO", "STRIKEOUT", "STRIKEOUTS"}:
+            if raw_stat in MLB_STRIKEOUT_STATS:
                 return "🟢 \n🟡 \n🔴 "
 
             # use the TB column for Total Bases
-            if raw_stat in {"TB", "TOTAL BASES"}:
+            if raw_stat in MLB_TOTAL_BASES_STATS:
                 stat_key = "TB"
             else:
                 stat_key = raw_stat
 
-            return analyze_mlb_psp(file_path, stat_key, row.get("teams", []))
+            return analyze_mlb_psp(df_psp, stat_key, p.raw_teams)
         else:
             return "PSP processing not configured for this sport."
         # *** PSP Branch End ***
@@ -1478,14 +2188,9 @@ def run_universal_sports_analyzer_programmatic(row):
             nba_injuries_path = os.path.join(REALSPORTS_DIR, "NBA", "nba_injury_report.csv")
             df = integrate_nba_data('nba_player_stats.csv', 'nba_injury_report.csv')
             # Filter by teams from the Notion row:
-            teams_list = row.get("teams", [])
-            if isinstance(teams_list, str):
-                teams_list = [normalize_team_name(t) for t in teams_list.split(",") if t.strip()]
-            else:
-                teams_list = [normalize_team_name(t) for t in teams_list]
             if teams_list:
-                df = df[df["TEAM"].apply(normalize_team_name).isin(teams_list)]
-            used_stat = row["stat"].upper() if row["stat"].strip() else "PPG"
+                df = df[team_isin(df["TEAM"], teams_list)]
+            used_stat = p.stat or "PPG"
             player_col = "PLAYER" if "PLAYER" in df.columns else "NAME"
             return categorize_players(df, STAT_CATEGORIES_NBA.get(used_stat, used_stat), target_val, player_col, "TEAM", stat_for_ban=used_stat)
 
@@ -1498,24 +2203,19 @@ def run_universal_sports_analyzer_programmatic(row):
         except FileNotFoundError:
             return f"❌ '{player_stats_file}' file not found."
         # Filter by teams from the Notion row:
-        teams_list = row.get("teams", [])
-        if isinstance(teams_list, str):
-            teams_list = [normalize_team_name(t) for t in teams_list.split(",") if t.strip()]
-        else:
-            teams_list = [normalize_team_name(t) for t in teams_list]
         if teams_list:
-            df = df[df["Team"].apply(normalize_team_name).isin(teams_list)]
-        used_stat = row["stat"].upper() if row["stat"].strip() else "PPG"
+            df = df[team_isin(df["Team"], teams_list)]
+        used_stat = p.stat or "PPG"
         return categorize_players(df, STAT_CATEGORIES_CBB.get(used_stat, used_stat), target_val, "Player", "Team", stat_for_ban=used_stat)
     elif sport_upper == "MLB":
         df = integrate_mlb_data()
         if df.empty:
             return "❌ No MLB data."
-        used_stat = row["stat"].upper() or "RBI"
+        used_stat = p.stat or "RBI"
         return analyze_mlb_noninteractive(df, teams, used_stat, banned_stat=used_stat)
     elif sport_upper == "NHL":
         df = integrate_nhl_data("nhl_player_stats.csv", "nhl_injuries.csv")
-        nhl_stat = row["stat"].upper() if row["stat"].strip() else "GOALS"
+        nhl_stat = p.stat or "GOALS"
         return analyze_nhl_noninteractive(df, teams, nhl_stat, target_val, nhl_stat)
 
     elif sport_upper == "WNBA":
@@ -1524,18 +2224,13 @@ def run_universal_sports_analyzer_programmatic(row):
         if df.empty or "TEAM" not in df.columns:
             return "❌ WNBA stats not found or empty."
 
-        # 2) normalize & filter by Notion-selected teams
-        teams_list = row.get("teams", [])
-        if isinstance(teams_list, str):
-            teams_list = [normalize_team_name(t) for t in teams_list.split(",") if t.strip()]
-        else:
-            teams_list = [normalize_team_name(t) for t in teams_list]
+        # 2) filter by Notion-selected teams
         if teams_list:
             df = df[df["TEAM"].isin(teams_list)]
 
         # 3) stat mapping & categorize
         # pick the right stat column
-        used_stat = row["stat"].upper() if row["stat"].strip() else "PPG"
+        used_stat = p.stat or "PPG"
         stat_key  = STAT_CATEGORIES_WNBA.get(used_stat, used_stat)
         return categorize_players(
             df,
@@ -1554,13 +2249,9 @@ def run_universal_sports_analyzer_programmatic(row):
             return "❌ Summer League stats not found."
 
         # 2) filter to the two teams (using your SNBA normalizer)
-        raw_teams = row.get("teams", [])
-        if isinstance(raw_teams, str):
-            teams_list = [normalize_snba_team_name(t) for t in raw_teams.split(",") if t.strip()]
-        else:
-            teams_list = [normalize_snba_team_name(t) for t in raw_teams]
+        teams_list = notion_team_list(p.raw_teams, normalize_snba_team_name)
         if teams_list:
-            df_sl = df_sl[df_sl["TEAM"].apply(normalize_snba_team_name).isin(teams_list)]
+            df_sl = df_sl[team_isin(df_sl["TEAM"], teams_list, SNBA_TEAM_ALIAS_SERIES)]
             if df_sl.empty:
                 return "❌ No SNBA players found for those teams."
 
@@ -1576,97 +2267,25 @@ def run_universal_sports_analyzer_programmatic(row):
             target = float(row["target"])
         except:
             return "❌ Invalid target for Summer League."
-        stat = (row["stat"] or "PPG").strip().upper()
+        stat = p.stat or "PPG"
         return analyze_summer_league_noninteractive(df_sl, stat, target)
     
     else:
         return "Sport not recognized."
 
-async def process_rows():
-    main_rows = fetch_unprocessed_rows(DATABASE_ID)
-    psp_rows = fetch_unprocessed_rows(PSP_DATABASE_ID)
-    all_rows = main_rows + psp_rows
-    poll_entries = []
-    for row in all_rows:
-        result = run_universal_sports_analyzer_programmatic(row)
-        if row.get("psp", False):
-            title = f"{row['sport'].upper()} PSP - {row['stat'].upper()}"
-        else:
-            title = f"Game: {row.get('team1','')} vs {row.get('team2','')} ({row['sport']}, {row['stat']}, Target: {row['target']})"
-        poll_entries.append({
-            "title": title,
-            "output": result
-        })
-        await mark_row_as_processed(row["page_id"])
-    await append_poll_entries_to_page(poll_entries)
-
-def psp_scrape_main():
-    rows = fetch_unprocessed_rows(PSP_DATABASE_ID)
-    if not rows:
-        print("No unprocessed PSP rows found.")
-        return
-    for row in rows:
-        page_id = row["page_id"]
-        teams = row["teams"]
-        sport = row["sport"]
-        stat = row["stat"]
-        data = scrape_statmuse_data(sport, stat, teams)
-        if data:
-            file_name = f"{sport.lower()}_{stat.lower().replace(' ', '_')}_psp_data.csv"
-            output_file = os.path.join(PSP_FOLDER, file_name)
-            pd.DataFrame(data).to_csv(output_file, index=False)
-            print(f"PSP data written to {output_file}")
-        else:
-            print("No data scraped for this row.")
-        mark_row_as_processed(page_id)
-
-def analyze_sport(df, stat_categories, player_col, team_col):
-    while True:
-        teams_input = input("\nEnter team names separated by commas (or 'exit' to return to main menu): ")
-        if teams_input.lower() == 'exit':
-            break
-        team_list = [normalize_team_name(t) for t in teams_input.split(",") if t.strip()]
-        filtered_df = df[df[team_col].astype(str).apply(normalize_team_name).isin(team_list)].copy()
-        if filtered_df.empty:
-            print("❌ No matching teams found. Please check the team names.")
-            continue
-        stat_choice = input("\nEnter stat to sort by: ").strip().upper()
-        if stat_choice not in stat_categories:
-            print("❌ Invalid stat choice. Please try again.")
-            continue
-        mapped_stat = stat_categories[stat_choice]
-        df_mode = filtered_df.copy()
-        try:
-            df_mode[mapped_stat] = pd.to_numeric(df_mode[mapped_stat], errors='coerce')
-        except Exception as e:
-            print("Error converting stat column to numeric:", e)
-            continue
-        target_value = input(f"\nEnter target {stat_choice} value (per game): ").strip()
-        if not target_value:
-            print("❌ Target value is required.")
-            continue
-        try:
-            target_value = float(target_value)
-        except Exception as e:
-            print("❌ Invalid target value.", e)
-            continue
-        result = categorize_players(df_mode, mapped_stat, target_value, player_col, team_col, stat_for_ban=stat_choice)
-        print(f"\nPlayer Performance Based on Target {target_value} {stat_choice}:")
-        print(result)
-
 def analyze_mlb_interactive(df):
     while True:
         teams_input = input("\nEnter MLB team names separated by commas (or 'exit' to return to main menu): ")
         if teams_input.lower() == 'exit':
             break
         team_list = [normalize_team_name(t) for t in teams_input.split(",") if t.strip()]
-        filtered_df = df[df["TEAM"].astype(str).apply(normalize_team_name).isin(team_list)].copy()
+        filtered_df = df[team_isin(df["TEAM"], team_list)]
         if filtered_df.empty:
             print("❌ No matching teams found. Please check the team names.")
             continue
         stat_choice = input("\nEnter MLB stat to sort by (e.g., RBI, G, AB, R, H, AVG, OBP, OPS, TB, SO): ").strip().upper()
         # If user types TB or TOTAL BASES, map to OPS and skip target input
-        if stat_choice in {"TB", "TOTAL BASES"}:
+        if stat_choice in MLB_TOTAL_BASES_STATS:
             stat_choice = "OPS"
             # Call non-interactive MLB analysis to simply get top 9 players
             result = analyze_mlb_noninteractive(filtered_df, teams_input, stat_choice, banned_stat=stat_choice)
@@ -1677,7 +2296,7 @@ def analyze_mlb_interactive(df):
             print("❌ Invalid MLB stat choice. Available options:", ", ".join(STAT_CATEGORIES_MLB.keys()))
             continue
         mapped_stat = STAT_CATEGORIES_MLB[stat_choice]
-        df_mode = filtered_df.copy()
+        df_mode = filtered_df
         try:
             df_mode[mapped_stat] = pd.to_numeric(df_mode[mapped_stat], errors='coerce')
         except Exception as e:
@@ -1696,13 +2315,6 @@ def analyze_mlb_interactive(df):
         print(f"\nMLB Player Performance Based on Target {target_value} {stat_choice}:")
         print(result)
 
-def analyze_mlb_by_team_interactive_wrapper():
-    df_mlb = integrate_mlb_data()
-    if df_mlb.empty:
-        print("MLB stats CSV not found or empty.")
-        return
-    analyze_mlb_by_team_interactive(df_mlb, mapped_stat="RBI")
-
 # ----------------------------
 # Missing function for MLB interactive analysis
 # ----------------------------
@@ -1717,15 +2329,15 @@ def analyze_mlb_by_team_interactive(df, mapped_stat):
             break
         if teams_input:
             team_list = [x.strip() for x in teams_input.split(",")]
-            filtered_df = df[df["TEAM"].astype(str).apply(normalize_team_name).isin(team_list)]
+            filtered_df = df[team_isin(df["TEAM"], team_list)]
         else:
             filtered_df = df
         if filtered_df.empty:
             print("❌ No matching teams found.")
             continue
-        sorted_df = filtered_df.sort_values(by=[mapped_stat], ascending=False)
-        sorted_df = sorted_df[~sorted_df["PLAYER"].apply(lambda x: is_banned(x, mapped_stat))]
-        non_banned = sorted_df["PLAYER"].tolist()
+        # drop banned players first, then only the top 9 need ordering
+        eligible = filtered_df[~isin_normalized(filtered_df["PLAYER"], banned_players_for(mapped_stat))]
+        non_banned = eligible.nlargest(9, mapped_stat)["PLAYER"].tolist()
         if len(non_banned) < 9:
             players_to_use = non_banned
         else:
@@ -1737,88 +2349,6 @@ def analyze_mlb_by_team_interactive(df, mapped_stat):
         print("🟡 " + ", ".join(yellow))
         print("🔴 " + ", ".join(red))
 
-# ----------------------------
-# PSP Scraping and Analyzer Functions (PSP Section) End
-# ----------------------------
-
-# ----------------------------
-# Main Notion Processing and PSP Scraper Entry Point
-# ----------------------------
-async def process_rows():
-    main_rows = fetch_unprocessed_rows(DATABASE_ID)
-    psp_rows = fetch_unprocessed_rows(PSP_DATABASE_ID)
-    all_rows = main_rows + psp_rows
-    poll_entries = []
-    for row in all_rows:
-        result = run_universal_sports_analyzer_programmatic(row)
-        if row.get("psp", False):
-            title = f"{row['sport'].upper()} PSP - {row['stat'].upper()}"
-        else:
-            title = f"Game: {row.get('team1','')} vs {row.get('team2','')} ({row['sport']}, {row['stat']}, Target: {row['target']})"
-        poll_entries.append({
-            "title": title,
-            "output": result
-        })
-        await mark_row_as_processed(row["page_id"])
-    await append_poll_entries_to_page(poll_entries)
-
-def psp_scrape_main():
-    rows = fetch_unprocessed_rows(PSP_DATABASE_ID)
-    if not rows:
-        print("No unprocessed PSP rows found.")
-        return
-    for row in rows:
-        page_id = row["page_id"]
-        teams = row["teams"]
-        sport = row["sport"]
-        stat = row["stat"]
-        data = scrape_statmuse_data(sport, stat, teams)
-        if data:
-            file_name = f"{sport.lower()}_{stat.lower().replace(' ', '_')}_psp_data.csv"
-            output_file = os.path.join(PSP_FOLDER, file_name)
-            pd.DataFrame(data).to_csv(output_file, index=False)
-            print(f"PSP data written to {output_file}")
-        else:
-            print("No data scraped for this row.")
-        mark_row_as_processed(page_id)
-
-# ----------------------------
-# Main Menu and Interactive Functions
-# ----------------------------
-def analyze_sport(df, stat_categories, player_col, team_col):
-    while True:
-        teams_input = input("\nEnter team names separated by commas (or 'exit' to return to main menu): ")
-        if teams_input.lower() == 'exit':
-            break
-        team_list = [normalize_team_name(t) for t in teams_input.split(",") if t.strip()]
-        filtered_df = df[df[team_col].astype(str).apply(normalize_team_name).isin(team_list)].copy()
-        if filtered_df.empty:
-            print("❌ No matching teams found. Please check the team names.")
-            continue
-        stat_choice = input("\nEnter stat to sort by: ").strip().upper()
-        if stat_choice not in stat_categories:
-            print("❌ Invalid stat choice. Please try again.")
-            continue
-        mapped_stat = stat_categories[stat_choice]
-        df_mode = filtered_df.copy()
-        try:
-            df_mode[mapped_stat] = pd.to_numeric(df_mode[mapped_stat], errors='coerce')
-        except Exception as e:
-            print("Error converting stat column to numeric:", e)
-            continue
-        target_value = input(f"\nEnter target {stat_choice} value (per game): ").strip()
-        if not target_value:
-            print("❌ Target value is required.")
-            continue
-        try:
-            target_value = float(target_value)
-        except Exception as e:
-            print("❌ Invalid target value.", e)
-            continue
-        result = categorize_players(df_mode, mapped_stat, target_value, player_col, team_col, stat_for_ban=stat_choice)
-        print(f"\nPlayer Performance Based on Target {target_value} {stat_choice}:")
-        print(result)
-
 def analyze_nhl_flow(df):
     # debug: print out exactly what abbreviations you have
     print("Available NHL team codes:", sorted(df["Team"].unique()))
@@ -1837,12 +2367,7 @@ def analyze_nhl_flow(df):
         ]
 
         # normalize and filter your DataFrame’s Team column
-        filtered_df = df[
-            df["Team"]
-              .astype(str)
-              .apply(normalize_team_name)
-              .isin(team_list)
-        ].copy()
+        filtered_df = df[team_isin(df["Team"], team_list)]
 
         if filtered_df.empty:
             print(f"❌ No matching teams found for {team_list}. Check the codes above.")
@@ -1855,76 +2380,22 @@ def analyze_nhl_flow(df):
 
         # convert to per-game if needed
         if stat_choice in ["ASSISTS", "POINTS", "S"]:
-            df_mode = calculate_nhl_per_game_stats(filtered_df.copy())
+            df_mode = calculate_nhl_per_game_stats(filtered_df)
         else:
-            df_mode = filtered_df.copy()
+            df_mode = filtered_df
 
         mapped_stat = STAT_CATEGORIES_NHL[stat_choice]
         df_mode[mapped_stat] = pd.to_numeric(df_mode[mapped_stat], errors='coerce')
 
-        # simple top/mid/bottom slices
-        players = df_mode.sort_values(by=mapped_stat, ascending=False)["Player"].drop_duplicates().tolist()
+        # simple top/mid/bottom slices; over-fetch by the number of repeated
+        # rows (traded players) so 9 distinct players survive drop_duplicates
+        extra = int(df_mode["Player"].duplicated().sum())
+        players = df_mode.nlargest(9 + extra, mapped_stat)["Player"].drop_duplicates().tolist()
         yellow, green, red = players[:3], players[3:6], players[6:9]
         print(f"\n🟢 {', '.join(green)}")
         print(f"🟡 {', '.join(yellow)}")
         print(f"🔴 {', '.join(red)}")
 
-def analyze_mlb_by_team_interactive_wrapper():
-    df_mlb = integrate_mlb_data()
-    if df_mlb.empty:
-        print("MLB stats CSV not found or empty.")
-        return
-    analyze_mlb_by_team_interactive(df_mlb, mapped_stat="RBI")
-
-# ----------------------------
-# Main Menu for MLB interactive analysis (Missing function already defined above)
-# ----------------------------
-
-# ----------------------------
-# PSP Scraping and Analyzer Functions (PSP Section) End
-# ----------------------------
-
-# ----------------------------
-# Main Notion Processing and PSP Scraper Entry Point
-# ----------------------------
-async def process_rows():
-    main_rows = fetch_unprocessed_rows(DATABASE_ID)
-    psp_rows = fetch_unprocessed_rows(PSP_DATABASE_ID)
-    all_rows = main_rows + psp_rows
-    poll_entries = []
-    for row in all_rows:
-        result = run_universal_sports_analyzer_programmatic(row)
-        if row.get("psp", False):
-            title = f"{row['sport'].upper()} PSP - {row['stat'].upper()}"
-        else:
-            title = f"Game: {row.get('team1','')} vs {row.get('team2','')} ({row['sport']}, {row['stat']}, Target: {row['target']})"
-        poll_entries.append({
-            "title": title,
-            "output": result
-        })
-        await mark_row_as_processed(row["page_id"])
-    await append_poll_entries_to_page(poll_entries)
-
-def psp_scrape_main():
-    rows = fetch_unprocessed_rows(PSP_DATABASE_ID)
-    if not rows:
-        print("No unprocessed PSP rows found.")
-        return
-    for row in rows:
-        page_id = row["page_id"]
-        teams = row["teams"]
-        sport = row["sport"]
-        stat = row["stat"]
-        data = scrape_statmuse_data(sport, stat, teams)
-        if data:
-            file_name = f"{sport.lower()}_{stat.lower().replace(' ', '_')}_psp_data.csv"
-            output_file = os.path.join(PSP_FOLDER, file_name)
-            pd.DataFrame(data).to_csv(output_file, index=False)
-            print(f"PSP data written to {output_file}")
-        else:
-            print("No data scraped for this row.")
-        mark_row_as_processed(page_id)
-
 # ----------------------------
 # Main Menu and Interactive Functions
 # ----------------------------
@@ -1934,7 +2405,7 @@ def analyze_sport(df, stat_categories, player_col, team_col):
         if teams_input.lower() == 'exit':
             break
         team_list = [normalize_team_name(t) for t in teams_input.split(",") if t.strip()]
-        filtered_df = df[df[team_col].astype(str).apply(normalize_team_name).isin(team_list)].copy()
+        filtered_df = df[team_isin(df[team_col], team_list)]
         if filtered_df.empty:
             print("❌ No matching teams found. Please check the team names.")
             continue
@@ -1943,7 +2414,7 @@ def analyze_sport(df, stat_categories, player_col, team_col):
             print("❌ Invalid stat choice. Please try again.")
             continue
         mapped_stat = stat_categories[stat_choice]
-        df_mode = filtered_df.copy()
+        df_mode = filtered_df
         try:
             df_mode[mapped_stat] = pd.to_numeric(df_mode[mapped_stat], errors='coerce')
         except Exception as e:
@@ -1976,49 +2447,134 @@ def analyze_mlb_by_team_interactive_wrapper():
 # ----------------------------
 # Main Notion Processing and PSP Scraper Entry Point
 # ----------------------------
+# One event loop for the whole CLI session instead of a fresh asyncio.run() per
+# menu pick, so its default executor (asyncio.to_thread workers) is reused
+_EVENT_LOOP = None
+
+def run_async(coro):
+    """Run `coro` to completion on the session's persistent event loop."""
+    global _EVENT_LOOP
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        _EVENT_LOOP = asyncio.new_event_loop()
+        atexit.register(_EVENT_LOOP.close)
+    return _EVENT_LOOP.run_until_complete(coro)
+
+def analyzer_input_key(row) -> tuple:
+    """Everything run_universal_sports_analyzer_programmatic reads from a row."""
+    teams = row.get("teams", [])
+    return (
+        row["sport"], row["stat"], row["target"], row.get("psp", False),
+        tuple(teams) if isinstance(teams, list) else teams,
+        row.get("team1", ""), row.get("team2", ""),
+    )
+
+def poll_entry_title(row) -> str:
+    if row.get("psp", False):
+        return f"{row['sport'].upper()} PSP - {row['stat'].upper()}"
+    return f"Game: {row.get('team1','')} vs {row.get('team2','')} ({row['sport']}, {row['stat']}, Target: {row['target']})"
+
+# How many Notion rows process_rows analyzes at once
+ROW_CONCURRENCY = int(os.getenv("ROW_CONCURRENCY", "6"))
+# Poll entries go to Notion in batches of up to POLL_BATCH_SIZE, or sooner once
+# no new result has arrived for POLL_FLUSH_SECONDS
+POLL_BATCH_SIZE = int(os.getenv("POLL_BATCH_SIZE", "10"))
+POLL_FLUSH_SECONDS = float(os.getenv("POLL_FLUSH_SECONDS", "2"))
+
+async def flush_poll_entries(queue):
+    """Drain (entry, page_id) pairs from `queue` until the None sentinel,
+    writing each batch to the poll page and marking its rows processed."""
+    done = False
+    while not done:
+        item = await queue.get()
+        if item is None:
+            break
+        batch = [item]
+        while len(batch) < POLL_BATCH_SIZE:
+            try:
+                item = await asyncio.wait_for(queue.get(), POLL_FLUSH_SECONDS)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                done = True
+                break
+            batch.append(item)
+        # the page append and the row updates are independent Notion writes
+        await asyncio.gather(
+            append_poll_entries_to_page([entry for entry, _ in batch]),
+            mark_rows_as_processed([page_id for _, page_id in batch]),
+        )
+
 async def process_rows():
-    main_rows = fetch_unprocessed_rows(DATABASE_ID)
-    psp_rows = fetch_unprocessed_rows(PSP_DATABASE_ID)
+    # the two database queries are independent, so overlap their round-trips
+    main_rows, psp_rows = await asyncio.gather(
+        asyncio.to_thread(fetch_unprocessed_rows, DATABASE_ID),
+        asyncio.to_thread(fetch_unprocessed_rows, PSP_DATABASE_ID),
+    )
     all_rows = main_rows + psp_rows
-    poll_entries = []
+    await asyncio.gather(
+        prefetch_psp_pages(psp_rows),
+        asyncio.to_thread(preload_sport_frames, rows_sports(all_rows)),
+    )
+    # analyze rows side by side on worker threads (scrapes, CSV I/O)
+    sem = asyncio.Semaphore(ROW_CONCURRENCY)
+
+    async def analyze(row):
+        async with sem:
+            return await asyncio.to_thread(run_universal_sports_analyzer_programmatic, row)
+
+    # polls asking the identical question (same sport/stat/teams/target/psp)
+    # share one analyzer run
+    tasks = {}
     for row in all_rows:
-        result = run_universal_sports_analyzer_programmatic(row)
-        if row.get("psp", False):
-            title = f"{row['sport'].upper()} PSP - {row['stat'].upper()}"
-        else:
-            title = f"Game: {row.get('team1','')} vs {row.get('team2','')} ({row['sport']}, {row['stat']}, Target: {row['target']})"
-        poll_entries.append({
-            "title": title,
-            "output": result
-        })
-        await mark_row_as_processed(row["page_id"])
-    await append_poll_entries_to_page(poll_entries)
+        key = analyzer_input_key(row)
+        if key not in tasks:
+            tasks[key] = asyncio.ensure_future(analyze(row))
+
+    # results are queued in row order as they become ready, so the poll page
+    # reads the same as before while the first batch goes out early
+    queue = asyncio.Queue(maxsize=32)
+
+    async def produce():
+        try:
+            for row in all_rows:
+                result = await tasks[analyzer_input_key(row)]
+                await queue.put(({"title": poll_entry_title(row), "output": result}, row["page_id"]))
+        finally:
+            await queue.put(None)
+
+    await asyncio.gather(produce(), flush_poll_entries(queue))
 
 def psp_scrape_main():
     rows = fetch_unprocessed_rows(PSP_DATABASE_ID)
     if not rows:
         print("No unprocessed PSP rows found.")
         return
-    for row in rows:
-        page_id = row["page_id"]
-        teams = row["teams"]
+    # scrape side by side on the fetch executor (one worker per pooled driver);
+    # CSV writes and Notion updates stay on this thread, in row order
+    frames = _FETCH_EXECUTOR.map(
+        lambda row: scrape_statmuse_data(row["sport"], row["stat"], row["teams"]), rows
+    )
+    for row, data in zip(rows, frames):
         sport = row["sport"]
         stat = row["stat"]
-        data = scrape_statmuse_data(sport, stat, teams)
-        if data:
+        if not data.empty:
             file_name = f"{sport.lower()}_{stat.lower().replace(' ', '_')}_psp_data.csv"
             output_file = os.path.join(PSP_FOLDER, file_name)
-            pd.DataFrame(data).to_csv(output_file, index=False)
+            write_psp_csv(data, output_file)
             print(f"PSP data written to {output_file}")
         else:
             print("No data scraped for this row.")
-        mark_row_as_processed(page_id)
+    run_async(mark_rows_as_processed([row["page_id"] for row in rows]))
 
 # ----------------------------
 # Main Menu and Interactive Functions
 # ----------------------------
 def main_menu():
     print("✅ Files loaded successfully")
+    # warm every sport's frame in the background while the user reads the menu;
+    # a pick that lands before it finishes just loads that sport itself
+    prefetch = ThreadPoolExecutor(max_workers=1)
+    prefetch.submit(preload_sport_frames)
     while True:
         print("\nSelect Option:")
         print("1️⃣ Interactive Sports Analyzer")
@@ -2038,31 +2594,31 @@ def main_menu():
             print("6: SNBA")
             sport_choice = input("Choose an option (1/2/3/4): ").strip()
             if sport_choice == '1':
-                df_cbb = integrate_cbb_data(player_stats_file="cbb_players_stats.csv", injury_data_file="cbb_injuries.csv")
+                df_cbb = get_sport_frame("CBB")
                 if df_cbb.empty:
                     continue
                 analyze_sport(df_cbb, STAT_CATEGORIES_CBB, "Player", "Team")
             elif sport_choice == '2':
-                df_nba = integrate_nba_data('nba_player_stats.csv', 'nba_injury_report.csv')
+                df_nba = get_sport_frame("NBA")
                 analyze_sport(df_nba, STAT_CATEGORIES_NBA, "PLAYER", "TEAM")
             elif sport_choice == '3':
-                df_nhl = integrate_nhl_data("nhl_player_stats.csv", "nhl_injuries.csv")
+                df_nhl = get_sport_frame("NHL")
                 analyze_nhl_flow(df_nhl)
             elif sport_choice == '4':
-                df_mlb = integrate_mlb_data()
+                df_mlb = get_sport_frame("MLB")
                 if df_mlb.empty:
                     print("MLB stats CSV not found or empty.")
                     continue
                 analyze_mlb_interactive(df_mlb)
             elif sport_choice == '5':
                 # WNBA just reuses the NBA mapping and the same analyze_sport()
-                df_wnba = integrate_wnba_data("wnba_player_stats.csv")
+                df_wnba = get_sport_frame("WNBA")
                 if df_wnba.empty:
                     print("WNBA stats CSV not found or empty.")
                     continue
                 analyze_sport(df_wnba, STAT_CATEGORIES_WNBA, "PLAYER", "TEAM")
             elif sport_choice == '6':
-                df_sl = load_summer_league_stats()
+                df_sl = get_sport_frame("SNBA")
                 if df_sl.empty:
                     print("❌ Summer League stats not found.")
                 else:
@@ -2072,15 +2628,22 @@ def main_menu():
                 print("❌ Invalid sport choice.")
         elif choice == '2':
             print("\n--- Processing Notion Poll Rows ---")
-            asyncio.run(process_rows())
+            run_async(process_rows())
         elif choice == '3':
             print("\n--- Running PSP Scraper ---")
             psp_scrape_main()
         elif choice == '4':
             print("\n--- Updating Stats & Injuries via Big Scraper ---")
-            subprocess.run(["python3", "big_scraper.py"])
+            from big_scraper import run as run_big_scraper
+            try:
+                run_big_scraper()
+            except Exception as e:
+                print(f"❌ Big Scraper failed: {e}")
+            # fresh CSVs invalidate the cached frames; rebuild them off the prompt
+            prefetch.submit(preload_sport_frames)
         elif choice == '5':
             print("👋 Exiting... Goodbye!")
+            prefetch.shutdown(wait=False, cancel_futures=True)
             break
         else:
             print("❌ Invalid choice. Please select 1, 2, 3, 4, or 5.")
@@ -10,6 +10,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+try:
+    import lxml  # noqa: F401  (C parser for BeautifulSoup; much faster than html.parser)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 from Universal_Sports_Analyzer import is_banned
 
@@ -116,7 +121,7 @@ def fetch_html(url):
     return html
 
 def parse_table(html_content):
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = BeautifulSoup(html_content, HTML_PARSER)
     container = soup.select_one("div.flex-1.overflow-x-auto")
     if not container:
         print("Container not found.")
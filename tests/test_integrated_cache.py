@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def summer_league_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "BASE_DIR", str(tmp_path))
+    monkeypatch.setattr(main, "INTEGRATED_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(main, "_INTEGRATED_CACHE", {})
+    (tmp_path / "summer_league_stats.csv").write_text(
+        "PLAYER,TEAM,GP,PPG\njohn doe,UTA,3,12.0\n", encoding="utf-8"
+    )
+    return tmp_path
+
+
+def _persisted(cache_dir):
+    return [os.path.join(cache_dir, f) for f in os.listdir(cache_dir)]
+
+
+def test_unchanged_loader_is_read_from_disk(summer_league_csv):
+    first = main.load_summer_league_stats()
+    (path,) = _persisted(summer_league_csv / "cache")
+    stored = os.stat(path).st_mtime_ns
+
+    main._INTEGRATED_CACHE.clear()  # as in a fresh process
+    again = main.load_summer_league_stats()
+
+    assert os.stat(path).st_mtime_ns == stored
+    assert again["PLAYER"].tolist() == first["PLAYER"].tolist() == ["John Doe"]
+
+
+def test_override_edit_rebuilds_persisted_frame(summer_league_csv, monkeypatch):
+    monkeypatch.setitem(main._SNBA_NAME_OVERRIDES, "john doe", "Johnny Doe")
+    assert main.load_summer_league_stats()["PLAYER"].tolist() == ["Johnny Doe"]
+
+    # same CSV mtime, edited override table, fresh process
+    monkeypatch.setitem(main._SNBA_NAME_OVERRIDES, "john doe", "Jon Doe")
+    main._INTEGRATED_CACHE.clear()
+
+    assert main.load_summer_league_stats()["PLAYER"].tolist() == ["Jon Doe"]